@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # 2018-08-31 16:34
-import ply.lex as lex
+import importlib.util
+import marshal
+import os
+import re
+import sys
+from array import array
+
+from rom import pack_rom
+from sourcemap import RUNTIME, SourceMap, is_function_label, is_runtime_label
 
 reserved = {
     "A",
@@ -64,13 +72,13 @@ def t_LABEL(t):
 
 
 def t_error(t):
-    print("Illegal character '%s'" % t.value[0])
+    t.lexer.assembler.error(
+        "Illegal character in line %d: '%s'" % (t.lexer.lineno, t.value[0])
+    )
     t.lexer.skip(1)
 
 
-import ply.yacc as yacc
-
-symbol_table = {
+predefined_symbols = {
     "R0": 0,
     "R1": 1,
     "R2": 2,
@@ -97,101 +105,554 @@ symbol_table = {
 }
 
 
+class Assembler:
+    # state of one assembly run, the parse actions reach it through
+    # `p.lexer.assembler` so any number of runs can share the lexer and parser
+    def __init__(self):
+        self.symbol_table = dict(predefined_symbols)
+        self.variable_index = 16
+        # single pass: `(LABEL)` declarations are collected in `label_table`
+        # and every `@LABEL` is recorded in `fixups` as (rom address, label),
+        # the placeholder in `program` is patched by `resolve_fixups` once
+        # the whole source has been seen
+        self.label_table = {}
+        self.fixups = []
+        self.program = array("H")
+        self.line_cache = {}
+        # errors are printed as they are found, `resolve_fixups` then fails
+        # instead of returning a program with missing or shifted words
+        self.errors = 0
+
+    def error(self, message):
+        print(message, file=sys.stderr)
+        self.errors += 1
+
+    def check(self):
+        if self.errors:
+            raise ValueError("assembly failed with %d errors" % self.errors)
+
+    def scan(self, lines, first_lineno=1, line_cache=None):
+        # hand-written line scanner, equivalent to (and much faster than)
+        # running `feed` on the same source. Decoded lines are memoized in
+        # `line_cache` (the assembler's own by default) by their raw text,
+        # returns the number of cache misses
+        if line_cache is None:
+            line_cache = self.line_cache
+        program = self.program
+        emit = program.append
+        misses = 0
+        for lineno, line in enumerate(lines, first_lineno):
+            entry = line_cache.get(line)
+            if entry is None:
+                entry = line_cache[line] = decode_line(line)
+                misses += 1
+            kind, value = entry
+            if kind == "W":
+                emit(value)
+            elif kind == "@":
+                self.fixups.append((len(program), value))
+                emit(0)
+            elif kind == "(":
+                self.label_table[value] = len(program)
+            elif kind == "!":
+                self.error("%s in line %d: %s" % (value[0], lineno, value[1]))
+        return misses
+
+    def feed(self, source):
+        base_lexer, parser = ply_parser()
+        lexer = base_lexer.clone()
+        lexer.lineno = 1
+        lexer.assembler = self
+        parser.parse(source, lexer=lexer)
+
+    def emit(self, word):
+        self.program.append(word)
+
+    def emit_label(self, label):
+        self.label_table[label] = len(self.program)
+
+    def emit_symbol(self, label):
+        self.fixups.append((len(self.program), label))
+        self.program.append(0)
+
+    def link(self, program, label_table, fixups, errors=0):
+        # appends a separately scanned chunk, addresses in its label table
+        # and fixups are relative to the start of the chunk
+        self.errors += errors
+        base = len(self.program)
+        self.program.extend(program)
+        for label, address in label_table.items():
+            self.label_table[label] = base + address
+        self.fixups.extend([(base + address, label) for address, label in fixups])
+
+    def resolve_fixups(self):
+        # labels take precedence over predefined symbols, the remaining symbols
+        # are variables allocated in order of their first reference
+        symbol_table = self.symbol_table
+        symbol_table.update(self.label_table)
+        for address, label in self.fixups:
+            if label not in symbol_table:
+                symbol_table[label] = self.variable_index
+                self.variable_index += 1
+            value = symbol_table[label]
+            if value > MAX_ADDRESS:
+                self.error("Address out of range: %s = %d" % (label, value))
+            else:
+                self.program[address] = encode_A_instr(value)
+        self.fixups = []
+        if len(self.program) > ROM_SIZE:
+            print(
+                "Warning: the program is %d words long, the ROM only holds %d"
+                % (len(self.program), ROM_SIZE),
+                file=sys.stderr,
+            )
+        self.check()
+        return self.program
+
+
+def assemble(source, scanner="fast", assembler=None):
+    # scanner: "fast" for the hand-written line scanner, "ply" for the
+    # reference ply lexer and parser. Pass an `assembler` to keep its symbol
+    # table and decoded lines after the build
+    if assembler is None:
+        assembler = Assembler()
+    if scanner == "fast":
+        assembler.scan(source.splitlines())
+    else:
+        assembler.feed(source)
+    return assembler.resolve_fixups()
+
+
+def assemble_stream(lines, chunk_size=4096, scanner="fast"):
+    # reads the source lazily, e.g. from an open file; labels are only known
+    # once the input is exhausted so the words are yielded after that
+    assembler = Assembler()
+    if scanner == "fast":
+        assembler.scan(lines)
+        yield from assembler.resolve_fixups()
+        return
+    chunk = []
+    for line in lines:
+        # a chunk made only of comments would be a syntax error
+        if line.split("//", 1)[0].strip():
+            chunk.append(line.rstrip("\n"))
+        if len(chunk) >= chunk_size:
+            assembler.feed("\n".join(chunk))
+            chunk = []
+    if chunk:
+        assembler.feed("\n".join(chunk))
+    yield from assembler.resolve_fixups()
+
+
+region_re = re.compile(r"\n(?=[ \t]*\()")
+
+
+def split_regions(source):
+    # -> (text, offset in the source) of the pieces of the source that start
+    # at a label declaration. The pieces only depend on their own text, so an
+    # edit leaves the others as they were
+    offset = 0
+    for text in region_re.split(source):
+        yield text, offset
+        offset += len(text) + 1
+
+
+class BuildCache:
+    # incremental mode: every region (see `split_regions`) of the previous
+    # build is kept with its words, its labels, the symbols it refers to and
+    # its words as resolved with their values. A region whose text is in the
+    # cache is not scanned again, and its resolved words are reused unless
+    # one of its symbols changed value, so an edit only rescans the regions
+    # it touches and only re-resolves the regions whose symbols moved.
+    # The cache file is written with marshal, which only holds data
+    version = 3
+
+    def __init__(self, path):
+        self.path = path
+        # text -> (words, label names, label offsets, symbols, fixup offsets,
+        # fixup symbol indices, symbol values, resolved words), the offsets
+        # relative to the region; the numbers are kept as the bytes of "H"
+        # arrays, which load much faster than lists of ints
+        self.regions = {}
+        self.symbol_table = {}
+        self.scanned = 0
+        self.resolved = 0
+        self.reused = 0
+        try:
+            with open(path, "rb") as f:
+                data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.regions = data["regions"]
+
+    def scan(self, text, lineno, line_cache):
+        # -> the region of `text` and its number of errors
+        assembler = Assembler()
+        assembler.scan(text.splitlines(), lineno, line_cache)
+        symbols = list(dict.fromkeys(label for _, label in assembler.fixups))
+        index = {label: i for i, label in enumerate(symbols)}
+        region = (
+            assembler.program.tobytes(),
+            list(assembler.label_table),
+            array("H", assembler.label_table.values()).tobytes(),
+            symbols,
+            array("H", [address for address, _ in assembler.fixups]).tobytes(),
+            array("H", [index[label] for _, label in assembler.fixups]).tobytes(),
+            None,
+            None,
+        )
+        return region, assembler.errors
+
+    def assemble(self, source):
+        cached = self.regions
+        regions = {}
+        layout = []
+        symbol_table = dict(predefined_symbols)
+        errors = 0
+        base = 0
+        self.scanned = 0
+        # the lines of the regions scanned in this build, and the line number
+        # of the last one, counted from there
+        line_cache = {}
+        lineno, lineno_offset = 1, 0
+        for text, offset in split_regions(source):
+            region = cached.get(text) or regions.get(text)
+            if region is None:
+                lineno += source.count("\n", lineno_offset, offset)
+                lineno_offset = offset
+                region, region_errors = self.scan(text, lineno, line_cache)
+                errors += region_errors
+                self.scanned += 1
+            regions[text] = region
+            layout.append(text)
+            if region[1]:
+                offsets = array("H")
+                offsets.frombytes(region[2])
+                for label, address in zip(region[1], offsets):
+                    symbol_table[label] = base + address
+            base += len(region[0]) // 2
+        if errors:
+            raise ValueError("assembly failed with %d errors" % errors)
+
+        # variables are allocated in order of first reference, as in
+        # `Assembler.resolve_fixups`
+        variable_index = 16
+        for text in layout:
+            for label in regions[text][3]:
+                if label not in symbol_table:
+                    symbol_table[label] = variable_index
+                    variable_index += 1
+        out_of_range = [
+            "Address out of range: %s = %d" % (label, value)
+            for label, value in symbol_table.items()
+            if value > MAX_ADDRESS
+        ]
+        if out_of_range:
+            print("\n".join(out_of_range), file=sys.stderr)
+            raise ValueError("assembly failed with %d errors" % len(out_of_range))
+
+        program = array("H")
+        self.resolved = self.reused = 0
+        for text in layout:
+            region = regions[text]
+            values = array("H", [symbol_table[label] for label in region[3]])
+            values = values.tobytes()
+            if values != region[6]:
+                resolved = array("H")
+                resolved.frombytes(region[0])
+                offsets = array("H")
+                offsets.frombytes(region[4])
+                indices = array("H")
+                indices.frombytes(region[5])
+                words = [symbol_table[label] for label in region[3]]
+                for address, i in zip(offsets, indices):
+                    resolved[address] = encode_A_instr(words[i])
+                region = regions[text] = region[:6] + (values, resolved.tobytes())
+                self.resolved += 1
+            else:
+                self.reused += 1
+            program.frombytes(region[7])
+        if len(program) > ROM_SIZE:
+            print(
+                "Warning: the program is %d words long, the ROM only holds %d"
+                % (len(program), ROM_SIZE),
+                file=sys.stderr,
+            )
+        # only the regions of this build are kept
+        self.regions = regions
+        self.symbol_table = symbol_table
+        return program
+
+    def save(self):
+        with open(self.path, "wb") as f:
+            marshal.dump({"version": self.version, "regions": self.regions}, f)
+
+    def report(self):
+        return "build cache: %d regions, %d scanned, %d resolved again, %d reused" % (
+            len(self.regions),
+            self.scanned,
+            self.resolved,
+            self.reused,
+        )
+
+
+def map_source(lines, symbol_table, source="", line_cache=None):
+    # builds the SourceMap of an assembled program from its source lines and
+    # resolved symbol table, `line_cache` holds the lines decoded by the build
+    source_map = SourceMap(source)
+    source_map.symbols = dict(symbol_table)
+    label = function = runtime = -1
+    if line_cache is None:
+        line_cache = {}
+    for lineno, line in enumerate(lines, 1):
+        entry = line_cache.get(line)
+        if entry is None:
+            entry = line_cache[line] = decode_line(line)
+        kind, value = entry
+        if kind == "(":
+            label = source_map.add_label(value)
+            if is_function_label(value):
+                function = label
+            elif is_runtime_label(value):
+                # the shared routines are credited to RUNTIME, not to a function
+                if runtime < 0:
+                    runtime = source_map.add_label(RUNTIME)
+                function = runtime
+        elif kind == "W" or kind == "@":
+            source_map.lines.append(lineno)
+            source_map.label.append(label)
+            source_map.function.append(function)
+    return source_map
+
+
+def scan_chunk(chunk):
+    # process pool worker for `assemble_parallel`
+    source, first_lineno = chunk
+    assembler = Assembler()
+    assembler.scan(source.splitlines(), first_lineno)
+    return assembler.program, assembler.label_table, assembler.fixups, assembler.errors
+
+
+def split_source(source, n_chunks):
+    # splits at line boundaries into about `n_chunks` pieces of similar size,
+    # each with the number of its first line
+    chunk_size = len(source) // n_chunks + 1
+    chunks = []
+    start = 0
+    lineno = 1
+    while start < len(source):
+        end = source.find("\n", start + chunk_size)
+        end = len(source) if end < 0 else end + 1
+        chunks.append((source[start:end], lineno))
+        lineno += source.count("\n", start, end)
+        start = end
+    return chunks
+
+
+def assemble_parallel(source, jobs=None, min_chunk_size=1 << 18, assembler=None):
+    # scans chunks of the source in a process pool and links the results in
+    # source order, so labels and variables resolve exactly as in `assemble`
+    jobs = jobs or os.cpu_count() or 1
+    n_chunks = min(jobs * 4, len(source) // min_chunk_size)
+    if jobs == 1 or n_chunks < 2:
+        return assemble(source, assembler=assembler)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if assembler is None:
+        assembler = Assembler()
+    with ProcessPoolExecutor(jobs) as pool:
+        for result in pool.map(scan_chunk, split_source(source, n_chunks)):
+            assembler.link(*result)
+    return assembler.resolve_fixups()
+
+
 def p_expression_stmt(p):
     """stmt : stmt stmt
     """
 
 
-global_lineno = 0
-
-
 def p_expression_LABEL(p):
     """stmt : LEFT_P LABEL RIGHT_P"""
-    global global_lineno
-    if first_pass:
-        symbol_table[p[2]] = global_lineno
+    p.lexer.assembler.emit_label(p[2])
+
+
+# an A-instruction holds a 15 bit value, so does the ROM address
+MAX_ADDRESS = 0x7FFF
+ROM_SIZE = MAX_ADDRESS + 1
 
 
 def encode_A_instr(num):
-    encoding = [0] * 16
-    i = 15
-    while num != 0:
-        encoding[i] = num & 1
-        num >>= 1
-        i -= 1
-    return encoding
+    # callers reject values above MAX_ADDRESS, they would set the top bit and
+    # turn the word into a C-instruction
+    return num
+
 
+hack_line_table = None
 
-def emit(p):
-    if not first_pass:
-        print("".join([str(i) for i in p]))
+
+def write_hack(f, words, chunk_size=1 << 16):
+    # .hack text output: each word is looked up in a table holding one encoded
+    # line per possible word (built on first use) and the lines are joined and
+    # written a chunk at a time
+    global hack_line_table
+    if hack_line_table is None:
+        hack_line_table = [b"%s\n" % format(i, "016b").encode() for i in range(1 << 16)]
+    lines = hack_line_table.__getitem__
+    for i in range(0, len(words), chunk_size):
+        f.write(b"".join(map(lines, words[i : i + chunk_size])))
 
 
 def p_expression_A_NUMBER(p):
     """stmt : AT NUMBER
     """
-    global global_lineno
-    global_lineno += 1
-
-    p[0] = encode_A_instr(int(p[2]))
-    emit(p[0])
-
-
-global_label_index = 16
+    num = int(p[2])
+    if num > MAX_ADDRESS:
+        p.lexer.assembler.error(
+            "Constant out of range in line %d: @%s" % (p.lineno(2), p[2])
+        )
+    else:
+        p.lexer.assembler.emit(encode_A_instr(num))
 
 
 def p_expression_A_LABEL(p):
     """stmt : AT LABEL
     """
-    global symbol_table, global_label_index, global_lineno
-    global_lineno += 1
+    p.lexer.assembler.emit_symbol(p[2])
+
+
+# C-instruction: 111a cccc ccdd djjj, the tables below hold each field
+# already shifted into place and are keyed on the mnemonic with spaces removed
+comp_table = {
+    "0": 0b0101010,
+    "1": 0b0111111,
+    "-1": 0b0111010,
+    "D": 0b0001100,
+    "A": 0b0110000,
+    "!D": 0b0001101,
+    "!A": 0b0110001,
+    "-D": 0b0001111,
+    "-A": 0b0110011,
+    "D+1": 0b0011111,
+    "A+1": 0b0110111,
+    "D-1": 0b0001110,
+    "A-1": 0b0110010,
+    "D+A": 0b0000010,
+    "D-A": 0b0010011,
+    "A-D": 0b0000111,
+    "D&A": 0b0000000,
+    "D|A": 0b0010101,
+}
+# the M forms are the A forms with the a-bit set
+comp_table.update(
+    {k.replace("A", "M"): v | 0b1000000 for k, v in comp_table.items() if "A" in k}
+)
+# commuted forms of the commutative operations on two registers, A+D, M|D
+# etc.; constants only ever come second (D+1 but not 1+D), as in the grammar
+comp_table.update(
+    {
+        k[2] + k[1] + k[0]: v
+        for k, v in comp_table.items()
+        if k[1:2] in ("+", "&", "|") and k[2] in "AM"
+    }
+)
+comp_table = {k: v << 6 for k, v in comp_table.items()}
+
+dest_table = {
+    "M": 0b001000,
+    "D": 0b010000,
+    "MD": 0b011000,
+    "A": 0b100000,
+    "AM": 0b101000,
+    "AD": 0b110000,
+    "AMD": 0b111000,
+}
+
+jump_table = {
+    "JGT": 0b001,
+    "JEQ": 0b010,
+    "JGE": 0b011,
+    "JLT": 0b100,
+    "JNE": 0b101,
+    "JLE": 0b110,
+    "JMP": 0b111,
+}
+
+
+def decode_line(line):
+    # -> (kind, value): ("W", word) for instructions without symbols,
+    # ("@", symbol) for symbolic A-instructions, ("(", label) for label
+    # declarations, ("", None) for blank lines and ("!", (error, text)) for
+    # errors
+    i = line.find("//")
+    if i >= 0:
+        line = line[:i]
+    line = "".join(line.split())
+    if not line:
+        return ("", None)
+
+    c = line[0]
+    if c == "@":
+        value = line[1:]
+        if value.isdigit():
+            if int(value) > MAX_ADDRESS:
+                return ("!", ("Constant out of range", line))
+            return ("W", encode_A_instr(int(value)))
+        if is_symbol(value):
+            return ("@", value)
+    elif c == "(":
+        label = line[1:-1]
+        if line[-1] == ")" and is_symbol(label):
+            return ("(", label)
+    else:
+        word = decode_C_instr(line)
+        if word is not None:
+            return ("W", word)
+    return ("!", ("Syntax error", line))
+
+
+symbol_re = re.compile(r"[a-zA-Z_][a-zA-Z0-9_\.\$]*")
 
-    label = p[2]
-    if not first_pass and label not in symbol_table:
-        symbol_table[label] = global_label_index
-        global_label_index += 1
 
-    if not first_pass:
-        num = symbol_table[label]
-        p[0] = encode_A_instr(num)
-    emit(p[0])
+def is_symbol(value):
+    # same rule as the LABEL token, the register and jump names are reserved
+    return symbol_re.fullmatch(value) is not None and value not in reserved
+
+
+def decode_C_instr(text):
+    dest, _, rest = text.rpartition("=")
+    comp, _, jump = rest.partition(";")
+    if dest and dest not in dest_table:
+        return None
+    if comp not in comp_table or (jump and jump not in jump_table):
+        return None
+    word = 0xE000 | comp_table[comp]
+    if dest:
+        word |= dest_table[dest]
+    if jump:
+        word |= jump_table[jump]
+    return word
 
 
 def p_expression_action_1(p):
     "action : dest EQUAL comp"
-    p[0] = p[3] + p[1]
+    p[0] = p[3] | p[1]
 
 
 def p_expression_action_2(p):
     "action : comp"
-    p[0] = p[1] + [0, 0, 0]
+    p[0] = p[1]
 
 
 def p_expression_C_1(p):
     "stmt : action SEMI_COLON jump"
-    global global_lineno
-    global_lineno += 1
-    p[0] = [1, 1, 1] + p[1] + p[3]
-    emit(p[0])
+    p.lexer.assembler.emit(0xE000 | p[1] | p[3])
 
 
 def p_expression_C_2(p):
     "stmt : action"
-    global global_lineno
-    global_lineno += 1
-    p[0] = [1, 1, 1] + p[1] + [0, 0, 0]
-    emit(p[0])
-
-
-jump_instruction = {
-    "JGT": [0, 0, 1],
-    "JEQ": [0, 1, 0],
-    "JGE": [0, 1, 1],
-    "JLT": [1, 0, 0],
-    "JNE": [1, 0, 1],
-    "JLE": [1, 1, 0],
-    "JMP": [1, 1, 1],
-}
+    p.lexer.assembler.emit(0xE000 | p[1])
 
 
 def p_expression_jump(p):
@@ -203,7 +664,7 @@ def p_expression_jump(p):
             | JLE
             | JMP
     """
-    p[0] = jump_instruction[p[1]]
+    p[0] = jump_table[p[1]]
 
 
 def p_expression_dest(p):
@@ -214,144 +675,183 @@ def p_expression_dest(p):
             | AM
             | AD 
             | AMD"""
-    dest = p[1]
-    p[0] = [0, 0, 0]
-    if "A" in dest:
-        p[0][0] = 1
-    if "D" in dest:
-        p[0][1] = 1
-    if "M" in dest:
-        p[0][2] = 1
+    p[0] = dest_table[p[1]]
 
 
-def p_expression_comp_0(p):
+def p_expression_comp(p):
     """comp : NUMBER
-    """
-    if p[1] == "0":
-        p[0] = [0, 1, 0, 1, 0, 1, 0]
-    elif p[1] == "1":
-        p[0] = [0, 1, 1, 1, 1, 1, 1]
-
-
-def p_expression_comp_1(p):
-    """comp : MINUS NUMBER
-    """
-    if p[2] == "1":
-        p[0] = [0, 1, 1, 1, 0, 1, 0]
-
-
-def p_expression_comp_2(p):
-    """comp : D
+            | MINUS NUMBER
+            | D
             | A
             | M
-    """
-    if p[1] == "D":
-        p[0] = [0, 0, 0, 1, 1, 0, 0]
-    else:
-        p[0] = [0, 1, 1, 0, 0, 0, 0]
-    if p[1] == "M":
-        p[0][0] = 1
-
-
-def p_expression_comp_3(p):
-    """comp : NOT D
+            | NOT D
             | NOT A
             | NOT M
-    """
-    if p[2] == "D":
-        p[0] = [0, 0, 0, 1, 1, 0, 1]
-    else:
-        p[0] = [0, 1, 1, 0, 0, 0, 1]
-
-    if p[2] == "M":
-        p[0][0] = 1
-
-
-def p_expression_comp_4(p):
-    """comp : MINUS D
+            | MINUS D
             | MINUS A
             | MINUS M
-    """
-    if p[2] == "D":
-        p[0] = [0, 0, 0, 1, 1, 1, 1]
-    else:
-        p[0] = [0, 1, 1, 0, 0, 1, 1]
-
-    if p[1] == "M":
-        p[0][0] = 1
-
-
-def p_expression_comp_5(p):
-    """comp : D PLUS NUMBER
+            | D PLUS NUMBER
             | A PLUS NUMBER
             | M PLUS NUMBER
             | D MINUS NUMBER
             | A MINUS NUMBER
-            | M MINUS NUMBER    
-    """
-    if p[2] == "+":
-        if p[1] == "D":
-            p[0] = [0, 0, 1, 1, 1, 1, 1]
-        else:
-            p[0] = [0, 1, 1, 0, 1, 1, 1]
-    else:
-        if p[1] == "D":
-            p[0] = [0, 0, 0, 1, 1, 1, 0]
-        else:
-            p[0] = [0, 1, 1, 0, 0, 1, 0]
-    if p[1] == "M":
-        p[0][0] = 1
-
-
-def p_expression_comp_6(p):
-    """comp : D PLUS A
-            | D PLUS M 
+            | M MINUS NUMBER
+            | D PLUS A
+            | D PLUS M
             | D MINUS A
             | D MINUS M
             | D AND A
             | D AND M
             | D OR A
-            | D OR M    
-    """
-    if p[2] == "+":
-        p[0] = [0, 0, 0, 0, 0, 1, 0]
-    elif p[2] == "-":
-        p[0] = [0, 0, 1, 0, 0, 1, 1]
-    elif p[2] == "&":
-        p[0] = [0, 0, 0, 0, 0, 0, 0]
-    elif p[2] == "|":
-        p[0] = [0, 0, 1, 0, 1, 0, 1]
-
-    if p[3] == "M":
-        p[0][0] = 1
-
-
-def p_expression_comp_7(p):
-    """comp : A MINUS D
+            | D OR M
+            | A PLUS D
+            | M PLUS D
+            | A AND D
+            | M AND D
+            | A OR D
+            | M OR D
+            | A MINUS D
             | M MINUS D
     """
-    p[0] = [0, 0, 0, 0, 1, 1, 1]
-    if p[1] == "M":
-        p[0][0] = 1
+    comp = "".join(p[1:])
+    if comp not in comp_table:
+        p.lexer.assembler.error(
+            "Illegal computation in line %d: '%s'" % (p.lineno(1), comp)
+        )
+        comp = "0"
+    p[0] = comp_table[comp]
 
 
 def p_error(p):
-    print("Syntax error in input!", p)
-
-
-first_pass = True
-
-parser = yacc.yacc()
+    if p is None:
+        raise ValueError("Syntax error at the end of the input")
+    p.lexer.assembler.error("Syntax error in line %d: '%s'" % (p.lineno, p.value))
+
+
+def load_parsetab():
+    # the tables are generated by projects/build_tables.py; they are loaded
+    # from this directory under a name of their own, so tools sharing a
+    # process never pick up each other's `parsetab`
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.py")
+    spec = importlib.util.spec_from_file_location(__name__ + "_parsetab", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ply_lexer_parser = None
+
+
+def ply_parser():
+    # ply is only imported and set up for the reference scanner
+    global ply_lexer_parser
+    if ply_lexer_parser is None:
+        import ply.lex as lex
+        import ply.yacc as yacc
+
+        module = sys.modules[__name__]
+        ply_lexer_parser = (
+            lex.lex(module=module),
+            yacc.yacc(
+                module=module,
+                debug=False,
+                write_tables=False,
+                tabmodule=load_parsetab(),
+            ),
+        )
+    return ply_lexer_parser
+
+
+import argparse
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Hack assembler")
+    arg_parser.add_argument("input", help="the .asm file")
+    arg_parser.add_argument(
+        "-o", "--output", help="the output file, standard output by default"
+    )
+    arg_parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="write a packed binary ROM image (see rom.py) instead of .hack text",
+    )
+    arg_parser.add_argument(
+        "-c",
+        "--object",
+        action="store_true",
+        help="write a relocatable object (see linker.py) instead of a program, "
+        "to the input name with .o by default",
+    )
+    arg_parser.add_argument(
+        "--scanner",
+        choices=("fast", "ply"),
+        default="fast",
+        help="the hand-written line scanner or the reference ply parser",
+    )
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="scan large sources in this many processes (0: one per cpu)",
+    )
+    arg_parser.add_argument(
+        "--cache",
+        help="incremental mode: keep the scanned and resolved regions of the "
+        "previous build in this file (see BuildCache)",
+    )
+    arg_parser.add_argument(
+        "--map",
+        help="also write a source map (ROM address -> line, label, VM function "
+        "and the symbol table) to this JSON file",
+    )
+    args = arg_parser.parse_args()
+
+    with open(args.input) as f:
+        source = f.read()
+    try:
+        if args.object:
+            from linker import make_object
+
+            name = os.path.splitext(os.path.basename(args.input))[0]
+            make_object(source, name).save(
+                args.output or os.path.splitext(args.input)[0] + ".o"
+            )
+            return
+        if args.cache:
+            cache = BuildCache(args.cache)
+            program = cache.assemble(source)
+            cache.save()
+            print(cache.report(), file=sys.stderr)
+            symbol_table, line_cache = cache.symbol_table, None
+        else:
+            assembler = Assembler()
+            if args.jobs != 1 and args.scanner == "fast":
+                program = assemble_parallel(source, args.jobs, assembler=assembler)
+            else:
+                program = assemble(source, args.scanner, assembler)
+            symbol_table, line_cache = assembler.symbol_table, assembler.line_cache
+        image = pack_rom(program) if args.binary else None
+    except ValueError as e:
+        raise SystemExit(e)
+    if args.map:
+        # the map reuses the symbol table and the decoded lines of the build,
+        # only the lines of a ply or parallel build are decoded again here
+        source_map = map_source(
+            source.splitlines(), symbol_table, args.input, line_cache
+        )
+        source_map.save(args.map)
+    if args.output:
+        output = open(args.output, "wb")
+    else:
+        output = sys.stdout.buffer
+    with output:
+        if args.binary:
+            output.write(image)
+        else:
+            write_hack(output, program)
 
-import sys
 
-with open(sys.argv[1]) as f:
-    prog = f.read()
-    # first pass
-    lexer = lex.lex()
-    parser.parse(prog)
-    global_lineno = 0
-    # second pass
-    first_pass = False
-    lexer = lex.lex()
-    parser.parse(prog)
+if __name__ == "__main__":
+    main()
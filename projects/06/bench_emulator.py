@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 21:40
+#
+# instructions per second of the decode-dispatch emulator against the block
+# translating one: Pong as shipped, Pong of projects/11 with the OS translated
+# by projects/08, and the wall time of the projects/08 FunctionCalls scripts
+import argparse
+import os
+import sys
+import time
+
+from assembler import assemble
+from emulator import BlockEmulator, Emulator, TestScript, read_program
+
+here = os.path.dirname(os.path.abspath(__file__))
+root = os.path.join(here, "..")
+
+scripts = [
+    "08/FunctionCalls/SimpleFunction/SimpleFunction.tst",
+    "08/FunctionCalls/NestedCall/NestedCall.tst",
+    "08/FunctionCalls/FibonacciElement/FibonacciElement.tst",
+    "08/FunctionCalls/StaticsTest/StaticsTest.tst",
+]
+
+
+def jack_pong():
+    sys.path.insert(0, os.path.join(root, "08"))
+    from VMTranslator import translate
+
+    # the whole OS in the default mode is about 47K words, more than the ROM
+    sources = [os.path.join(root, "11/Pong"), os.path.join(root, "..", "tools/OS")]
+    program = assemble(
+        translate(sources, bootstrap=True, whole_program=True, compact=True)
+    )
+    assert len(program) <= 32768, len(program)
+    return program
+
+
+def measure_program(program, emulator, cycles, repeat):
+    # -> instructions per second, translation included
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        emulator(program).run(cycles)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return cycles / best
+
+
+def measure_script(path, emulator, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        failure = TestScript(path, emulator=emulator).run()
+        elapsed = time.perf_counter() - start
+        if failure:
+            raise SystemExit("%s: %s" % (path, failure))
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="emulator benchmark")
+    arg_parser.add_argument("--cycles", type=int, default=10**7)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    programs = [
+        ("06/Pong.hack", read_program(os.path.join(here, "Pong.hack"))),
+        ("11/Pong + OS", jack_pong()),
+    ]
+    print("%-54s %12s %12s %8s" % ("program", "dispatch", "blocks", "speedup"))
+    for name, program in programs:
+        step = measure_program(program, Emulator, args.cycles, args.repeat)
+        blocks = measure_program(program, BlockEmulator, args.cycles, args.repeat)
+        print(
+            "%-54s %10.2fM/s %10.2fM/s %7.1fx"
+            % (name, step / 1e6, blocks / 1e6, blocks / step)
+        )
+    for script in scripts:
+        path = os.path.join(root, script)
+        step = measure_script(path, Emulator, args.repeat)
+        blocks = measure_script(path, BlockEmulator, args.repeat)
+        print(
+            "%-54s %10.1fms %10.1fms %7.1fx"
+            % (script, 1e3 * step, 1e3 * blocks, step / blocks)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 11:05
+#
+# compares the hand-written scanner against the ply parser on a large source,
+# made by repeating the given .asm file until it has at least --lines lines
+import argparse
+import time
+
+from assembler import assemble
+
+
+def measure(source, scanner, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        program = assemble(source, scanner)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return program, best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="assembler scanner benchmark")
+    arg_parser.add_argument("input", nargs="?", default="pong/Pong.asm")
+    arg_parser.add_argument("--lines", type=int, default=200000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with open(args.input) as f:
+        source = f.read()
+    n_lines = source.count("\n") + 1
+    source = "\n".join([source] * max(1, args.lines // n_lines))
+    n_lines = source.count("\n") + 1
+
+    ply_program, ply_time = measure(source, "ply", args.repeat)
+    fast_program, fast_time = measure(source, "fast", args.repeat)
+    if ply_program != fast_program:
+        raise SystemExit("scanners disagree on %s" % args.input)
+
+    print("%d lines, %d instructions" % (n_lines, len(fast_program)))
+    for name, elapsed in (("ply", ply_time), ("fast", fast_time)):
+        print("%-5s %8.3fs %12.0f lines/s" % (name, elapsed, n_lines / elapsed))
+    print("speedup %.1fx" % (ply_time / fast_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 21:10
+#
+# Hack CPU emulator, without the JVM of tools/CPUEmulator. Every ROM word is
+# decoded once into a (kind, comp, dest, jump) tuple:
+#   (0, value, 0, 0)          A-instruction
+#   (1, f(a, d, m), dest, jump)
+#                             C-instruction, f computes the signed 16 bit result
+# and the fetch/execute loop works on those, over a RAM of signed shorts.
+#
+# `BlockEmulator` runs the code it reaches often as Python instead: the
+# basic blocks, chained through their constant jump targets, are generated as
+# source, compiled once with compile/exec and kept by their start address.
+#
+# It also runs the CPU emulator test scripts (.tst) of projects 04 to 08:
+# load, output-file, compare-to, output-list, set, repeat, ticktock and output,
+# compared with the .cmp file line by line as the Java tool does
+import argparse
+import os
+import re
+import sys
+import time
+from array import array
+
+from assembler import assemble
+from rom import is_rom, load_rom
+
+RAM_SIZE = 32768
+
+# a + c1..c6 -> the ALU function, results wrapped to 16 bits where they can
+# leave the range
+comp_functions = {
+    0b0101010: lambda a, d, m: 0,
+    0b0111111: lambda a, d, m: 1,
+    0b0111010: lambda a, d, m: -1,
+    0b0001100: lambda a, d, m: d,
+    0b0110000: lambda a, d, m: a,
+    0b1110000: lambda a, d, m: m,
+    0b0001101: lambda a, d, m: ~d,
+    0b0110001: lambda a, d, m: ~a,
+    0b1110001: lambda a, d, m: ~m,
+    0b0001111: lambda a, d, m: (32768 - d & 65535) - 32768,
+    0b0110011: lambda a, d, m: (32768 - a & 65535) - 32768,
+    0b1110011: lambda a, d, m: (32768 - m & 65535) - 32768,
+    0b0011111: lambda a, d, m: (d + 32769 & 65535) - 32768,
+    0b0110111: lambda a, d, m: (a + 32769 & 65535) - 32768,
+    0b1110111: lambda a, d, m: (m + 32769 & 65535) - 32768,
+    0b0001110: lambda a, d, m: (d + 32767 & 65535) - 32768,
+    0b0110010: lambda a, d, m: (a + 32767 & 65535) - 32768,
+    0b1110010: lambda a, d, m: (m + 32767 & 65535) - 32768,
+    0b0000010: lambda a, d, m: (d + a + 32768 & 65535) - 32768,
+    0b1000010: lambda a, d, m: (d + m + 32768 & 65535) - 32768,
+    0b0010011: lambda a, d, m: (d - a + 32768 & 65535) - 32768,
+    0b1010011: lambda a, d, m: (d - m + 32768 & 65535) - 32768,
+    0b0000111: lambda a, d, m: (a - d + 32768 & 65535) - 32768,
+    0b1000111: lambda a, d, m: (m - d + 32768 & 65535) - 32768,
+    0b0000000: lambda a, d, m: d & a,
+    0b1000000: lambda a, d, m: d & m,
+    0b0010101: lambda a, d, m: d | a,
+    0b1010101: lambda a, d, m: d | m,
+}
+
+
+# the same as Python expressions of d, {a} and {m}
+comp_expressions = {
+    0b0101010: "0",
+    0b0111111: "1",
+    0b0111010: "-1",
+    0b0001100: "d",
+    0b0110000: "{a}",
+    0b1110000: "{m}",
+    0b0001101: "~d",
+    0b0110001: "~{a}",
+    0b1110001: "~{m}",
+    0b0001111: "(32768 - d & 65535) - 32768",
+    0b0110011: "(32768 - {a} & 65535) - 32768",
+    0b1110011: "(32768 - {m} & 65535) - 32768",
+    0b0011111: "(d + 32769 & 65535) - 32768",
+    0b0110111: "({a} + 32769 & 65535) - 32768",
+    0b1110111: "({m} + 32769 & 65535) - 32768",
+    0b0001110: "(d + 32767 & 65535) - 32768",
+    0b0110010: "({a} + 32767 & 65535) - 32768",
+    0b1110010: "({m} + 32767 & 65535) - 32768",
+    0b0000010: "(d + {a} + 32768 & 65535) - 32768",
+    0b1000010: "(d + {m} + 32768 & 65535) - 32768",
+    0b0010011: "(d - {a} + 32768 & 65535) - 32768",
+    0b1010011: "(d - {m} + 32768 & 65535) - 32768",
+    0b0000111: "({a} - d + 32768 & 65535) - 32768",
+    0b1000111: "({m} - d + 32768 & 65535) - 32768",
+    0b0000000: "d & {a}",
+    0b1000000: "d & {m}",
+    0b0010101: "d | {a}",
+    0b1010101: "d | {m}",
+}
+
+# jump bits -> the condition on the computed value
+jump_conditions = {
+    1: "{v} > 0",
+    2: "{v} == 0",
+    3: "{v} >= 0",
+    4: "{v} < 0",
+    5: "{v} != 0",
+    6: "{v} <= 0",
+    7: "True",
+}
+
+# longest trace, most traces in a region translated as one function, and
+# how often an address is run before it is translated
+MAX_TRACE_SIZE = 256
+MAX_REGION_TRACES = 32
+HOT_COUNT = 16
+
+
+def decode(word):
+    if not word & 0x8000:
+        return (0, word, 0, 0)
+    comp = comp_functions.get(word >> 6 & 0x7F)
+    if comp is None:
+        raise ValueError(f"invalid instruction {word:016b}")
+    return (1, comp, word >> 3 & 7, word & 7)
+
+
+def read_program(path):
+    # .hack text, a packed ROM image (see rom.py) or .asm source
+    if is_rom(path):
+        return load_rom(path)
+    with open(path) as f:
+        text = f.read()
+    if path.endswith(".asm"):
+        return assemble(text)
+    return [int(line, 2) for line in text.split()]
+
+
+class Emulator:
+    def __init__(self, program=()):
+        self.ram = array("h", bytes(2 * RAM_SIZE))
+        self.load(program)
+
+    def load(self, program):
+        # program: the words, e.g. `assemble` output or `read_program`
+        decoded = {}
+        self.program = []
+        for word in program:
+            if word not in decoded:
+                decoded[word] = decode(word)
+            self.program.append(decoded[word])
+        self.reset()
+
+    def reset(self):
+        # registers only, the RAM is left as it is
+        self.a = self.d = self.pc = 0
+        self.cycles = 0
+        self.halted = False
+
+    def run(self, max_cycles):
+        # -> the number of instructions executed, `max_cycles` unless the
+        # program halts first: it runs off the end of the ROM or enters the
+        # `(END) @END 0;JMP` loop, in which nothing changes any more.
+        # A is kept signed: as an address its negative values alias the top
+        # half of the RAM exactly as the 15 address bits do
+        program = self.program
+        ram = self.ram
+        a, d, pc = self.a, self.d, self.pc
+        end = len(program)
+        cycles = 0
+        while cycles < max_cycles:
+            if pc >= end:
+                self.halted = True
+                break
+            kind, comp, dest, jump = program[pc]
+            cycles += 1
+            if not kind:
+                a = comp
+                pc += 1
+                continue
+            value = comp(a, d, ram[a])
+            if dest:
+                if dest & 1:
+                    ram[a] = value
+                if dest & 2:
+                    d = value
+                if dest & 4:
+                    a = value
+            if jump and (
+                jump & 4 and value < 0
+                or jump & 2 and value == 0
+                or jump & 1 and value > 0
+            ):
+                target = a & 0x7FFF
+                if (
+                    jump == 7
+                    and not dest
+                    and target == pc - 1
+                    and program[target] == (0, target, 0, 0)
+                ):
+                    self.halted = True
+                    pc = target
+                    break
+                pc = target
+            else:
+                pc += 1
+        self.a, self.d, self.pc = a, d, pc
+        self.cycles += cycles
+        return cycles
+
+    def get(self, name):
+        if name.startswith("RAM["):
+            return self.ram[int(name[4:-1])]
+        elif name == "time":
+            return self.cycles
+        return getattr(self, name.lower())
+
+    def set(self, name, value):
+        if name.startswith("RAM["):
+            self.ram[int(name[4:-1])] = value
+        else:
+            setattr(self, name.lower(), value)
+            if name == "PC":
+                self.halted = False
+
+
+class BlockEmulator(Emulator):
+    # the code from an address is translated as a trace: its instructions
+    # in order, continuing at the target of unconditional jumps to constant
+    # addresses and with an early exit for every conditional jump taken. A
+    # trace jumping back to its start loops by itself. The traces reachable
+    # from one another through constant addresses are compiled together into
+    # a region, a function going from trace to trace in a loop on pc until
+    # it leaves the region or its budget:
+    #   f(a, d, ram, budget) -> (a, d, pc, cycles, halted)
+    # Only the addresses reached `HOT_COUNT` times get a region, until then
+    # the code up to the next jump is run by `Emulator.run`, as is whatever is
+    # left of the budget when no whole trace fits
+    def load(self, program):
+        self.words = list(program)
+        Emulator.load(self, self.words)
+        # (function, size) by start address, None until it is hot
+        self.regions = [None] * len(self.words)
+        self.heat = array("H", bytes(2 * len(self.words)))
+        # the number of words from an address to its next jump included
+        self.straight = array("H", bytes(2 * len(self.words)))
+        size = 0
+        for pc in reversed(range(len(self.words))):
+            word = self.words[pc]
+            size = 1 if word & 0x8007 > 0x8000 else min(size + 1, 65535)
+            self.straight[pc] = size
+
+    def trace(self, start):
+        # -> (steps, size, the constant addresses it exits to) for the trace
+        # at `start`, `size` the most instructions it runs before an exit or
+        # its loop. The steps are ("code", line), ("exit", condition, A,
+        # pc, halt) and ("loop", condition, A): A the constant in A to set
+        # before, `halt` the address of the `(END) @END 0;JMP` loop when the
+        # jump may be the one of that loop, else -1
+        words = self.words
+        steps = []
+        exits = []
+        # A as an expression: the constant of the last A-instruction as long
+        # as nothing computed it
+        a = "a"
+        cycles = 0
+        visited = {start}
+        pc = start
+        while True:
+            if pc >= len(words) or cycles >= MAX_TRACE_SIZE:
+                steps.append(("exit", None, a, str(pc), -1))
+                exits.append(pc)
+                break
+            word = words[pc]
+            pc += 1
+            cycles += 1
+            steps.append(("code", "cycles += 1"))
+            if not word & 0x8000:
+                a = str(word)
+                continue
+            dest, jump = word >> 3 & 7, word & 7
+            value = comp_expressions[word >> 6 & 0x7F].format(a=a, m=f"ram[{a}]")
+            if jump == 7 and not dest or value in ("d", "a"):
+                pass
+            elif jump or dest.bit_count() > 1:
+                steps.append(("code", f"v = {value}"))
+                value = "v"
+            if dest & 1:
+                steps.append(("code", f"ram[{a}] = {value}"))
+            if dest & 2:
+                steps.append(("code", f"d = {value}"))
+            if dest & 4:
+                steps.append(("code", f"a = {value}"))
+                a = "a"
+            if not jump:
+                continue
+            halt = -1
+            if jump == 7 and not dest and pc > 1 and words[pc - 2] == pc - 2:
+                halt = pc - 2
+            condition = jump_conditions[jump].format(v=value)
+            if a == "a":
+                steps.append(("exit", condition, a, "a & 32767", halt))
+                if jump == 7:
+                    break
+                continue
+            target = int(a) & 32767
+            if target == start and halt != target:
+                steps.append(("loop", condition, a))
+            elif jump == 7 and target not in visited and halt != target:
+                # go on at the target
+                visited.add(target)
+                pc = target
+                continue
+            else:
+                steps.append(("exit", condition, a, str(target), halt))
+                exits.append(target)
+            if jump == 7:
+                break
+            visited.add(pc)
+        # the cycles are counted once before every exit
+        merged = []
+        count = 0
+        for step in steps:
+            if step == ("code", "cycles += 1"):
+                count += 1
+                continue
+            if count and step[0] != "code":
+                merged.append(("code", f"cycles += {count}"))
+                count = 0
+            merged.append(step)
+        return merged, cycles, exits
+
+    def translate(self, start):
+        # -> (function, size) of the region starting at `start`, `size` the
+        # budget it needs at least
+        traces = []
+        todo = [start]
+        seen = set()
+        while todo and len(traces) < MAX_REGION_TRACES:
+            pc = todo.pop(0)
+            if pc in seen or pc >= len(self.words):
+                continue
+            seen.add(pc)
+            steps, size, exits = self.trace(pc)
+            traces.append((pc, steps, size))
+            todo += exits
+
+        size = max(size for _, _, size in traces)
+        source = [
+            "def region(a, d, ram, budget):",
+            "    cycles = 0",
+            f"    limit = budget - {size}",
+            f"    pc = {start}",
+            "    while cycles <= limit:",
+        ]
+        for i, (pc, steps, _) in enumerate(traces):
+            source.append(f"        {'if' if i == 0 else 'elif'} pc == {pc}:")
+            source += render_trace(pc, steps, "            ")
+        source += [
+            "        else:",
+            "            break",
+            "    return a, d, pc, cycles, False",
+        ]
+        namespace = {}
+        exec(compile("\n".join(source), f"<region {start}>", "exec"), namespace)
+        return namespace["region"], size
+
+    def run(self, max_cycles):
+        regions = self.regions
+        heat = self.heat
+        ram = self.ram
+        a, d, pc = self.a, self.d, self.pc
+        end = len(regions)
+        # all the instructions run, and those of the regions: `Emulator.run`
+        # counts its own in `self.cycles`
+        cycles = 0
+        translated = 0
+        while pc < end:
+            region = regions[pc]
+            if region is None:
+                heat[pc] += 1
+                if heat[pc] < HOT_COUNT:
+                    size = min(self.straight[pc], max_cycles - cycles)
+                    if not size:
+                        break
+                    self.a, self.d, self.pc = a, d, pc
+                    cycles += Emulator.run(self, size)
+                    a, d, pc = self.a, self.d, self.pc
+                    if self.halted:
+                        break
+                    continue
+                region = regions[pc] = self.translate(pc)
+            function, size = region
+            if cycles + size > max_cycles:
+                break
+            a, d, pc, executed, halted = function(a, d, ram, max_cycles - cycles)
+            cycles += executed
+            translated += executed
+            if halted:
+                self.halted = True
+                break
+        else:
+            self.halted = True
+        self.a, self.d, self.pc = a, d, pc
+        self.cycles += translated
+        if cycles < max_cycles and not self.halted:
+            cycles += Emulator.run(self, max_cycles - cycles)
+        return cycles
+
+
+def render_trace(start, steps, indent):
+    # -> the lines of the trace; a looping trace is wrapped in a loop of its
+    # own, left with break, the others leave with continue
+    loops = any(step[0] == "loop" for step in steps)
+    leave = "break" if loops else "continue"
+    lines = []
+    if loops:
+        lines.append(indent + "while True:")
+        indent += "    "
+    for step in steps:
+        if step[0] == "code":
+            lines.append(indent + step[1])
+            continue
+        inner = indent
+        if step[1] not in (None, "True"):
+            lines.append(f"{indent}if {step[1]}:")
+            inner += "    "
+        if step[2] != "a":
+            lines.append(f"{inner}a = {step[2]}")
+        if step[0] == "loop":
+            lines += [
+                f"{inner}if cycles <= limit:",
+                f"{inner}    continue",
+                f"{inner}pc = {start}",
+                f"{inner}break",
+            ]
+            continue
+        _, _, _, target, halt = step
+        lines.append(f"{inner}pc = {target}")
+        if halt >= 0:
+            lines += [
+                f"{inner}if pc == {halt}:",
+                f"{inner}    return a, d, pc, cycles, True",
+            ]
+        lines.append(f"{inner}{leave}")
+    return lines
+
+
+class ScriptError(Exception):
+    pass
+
+
+# output-list entries: name%<format><left>.<width>.<right>
+output_column = re.compile(r"([^%\s]+)(?:%([BDXS])(\d+)\.(\d+)\.(\d+))?$")
+
+
+def format_value(value, kind, width):
+    if kind == "B":
+        return format(value & 0xFFFF, "016b")[-width:]
+    elif kind == "X":
+        return format(value & 0xFFFF, "04X")[-width:]
+    return str(value)
+
+
+def center(text, width):
+    # the spare space goes right
+    text = text[:width]
+    left = (width - len(text)) // 2
+    return " " * left + text + " " * (width - len(text) - left)
+
+
+def tokenize(script):
+    script = re.sub(r"/\*.*?\*/|//[^\n]*", " ", script, flags=re.S)
+    return re.findall(r'"[^"]*"|[{}]|[,;!]|[^\s,;!{}]+', script)
+
+
+def parse_script(tokens):
+    # -> [statement], a statement is its list of words or ("repeat", n, body)
+    statements = []
+    words = []
+    while tokens:
+        token = tokens.pop(0)
+        if token in (",", ";", "!"):
+            if words:
+                statements.append(words)
+            words = []
+        elif token == "{":
+            if len(words) != 2 or words[0] != "repeat":
+                raise ScriptError(f"unsupported block: {' '.join(words)}")
+            statements.append(("repeat", int(words[1]), parse_script(tokens)))
+            words = []
+        elif token == "}":
+            break
+        else:
+            words.append(token)
+    if words:
+        statements.append(words)
+    return statements
+
+
+class TestScript:
+    # `program` replaces what the script loads, e.g. the output of another
+    # translator; `scale` multiplies the repeat counts for slower code;
+    # `emulator` is the class running it
+    def __init__(self, path, program=None, scale=1, emulator=Emulator):
+        self.directory = os.path.dirname(os.path.abspath(path))
+        with open(path) as f:
+            self.statements = parse_script(tokenize(f.read()))
+        self.program = program
+        self.scale = scale
+        self.emulator = emulator()
+        self.columns = []
+        self.output = []
+        self.compare = None
+        self.output_file = None
+
+    def run(self):
+        # -> None when the script ends with all the outputs as compared,
+        # the failure otherwise; the output file is written in both cases
+        try:
+            return self.execute(self.statements)
+        finally:
+            if self.output_file:
+                with open(self.output_file, "w") as f:
+                    f.write("".join(line + "\n" for line in self.output))
+
+    def execute(self, statements):
+        for statement in statements:
+            if statement[0] == "repeat":
+                _, count, body = statement
+                if all(words == ["ticktock"] for words in body):
+                    self.emulator.run(count * len(body) * self.scale)
+                    continue
+                for _ in range(count * self.scale):
+                    failure = self.execute(body)
+                    if failure:
+                        return failure
+                continue
+            failure = self.command(statement[0], statement[1:])
+            if failure:
+                return failure
+        return None
+
+    def command(self, name, args):
+        if name == "load":
+            if self.program is not None:
+                program = self.program
+            else:
+                program = read_program(os.path.join(self.directory, args[0]))
+            self.emulator.load(program)
+        elif name == "output-file":
+            self.output_file = os.path.join(self.directory, args[0])
+        elif name == "compare-to":
+            with open(os.path.join(self.directory, args[0])) as f:
+                self.compare = f.read().splitlines()
+        elif name == "output-list":
+            self.columns = []
+            for arg in args:
+                match = output_column.match(arg)
+                if match is None:
+                    raise ScriptError(f"bad output-list entry {arg}")
+                column, kind, left, width, right = match.groups()
+                if kind is None:
+                    kind, left, width, right = "D", 1, 6, 1
+                self.columns.append((column, kind, int(left), int(width), int(right)))
+            return self.emit(
+                "|".join(
+                    center(column, left + width + right)
+                    for column, _, left, width, right in self.columns
+                )
+            )
+        elif name == "set":
+            self.emulator.set(args[0], int(args[1]))
+        elif name == "ticktock":
+            self.emulator.run(1)
+        elif name == "output":
+            return self.emit(
+                "|".join(
+                    " " * left
+                    + format_value(self.emulator.get(column), kind, width).rjust(width)
+                    + " " * right
+                    for column, kind, left, width, right in self.columns
+                )
+            )
+        elif name not in ("echo", "clear-echo"):
+            raise ScriptError(f"unsupported command {name}")
+        return None
+
+    def emit(self, line):
+        # -> the failure if the line differs from the compare file, where *
+        # matches anything
+        line = "|" + line + "|"
+        self.output.append(line)
+        if self.compare is None:
+            return None
+        number = len(self.output)
+        if number > len(self.compare):
+            return f"comparison failure at line {number}: nothing to compare"
+        expected = self.compare[number - 1]
+        if len(line) != len(expected) or any(
+            c != e and e != "*" for c, e in zip(line, expected)
+        ):
+            return f"comparison failure at line {number}:\n  {line}\n  {expected}"
+        return None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Hack CPU emulator")
+    arg_parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="test scripts (.tst), or a program (.hack, .asm or ROM image) to run",
+    )
+    arg_parser.add_argument(
+        "-n",
+        "--cycles",
+        type=int,
+        default=10**8,
+        help="run a program for at most this many instructions",
+    )
+    arg_parser.add_argument(
+        "--ram",
+        type=int,
+        nargs="*",
+        default=[],
+        help="the RAM addresses to print once a program stops",
+    )
+    arg_parser.add_argument(
+        "--program", help="run the test scripts on this program instead of theirs"
+    )
+    arg_parser.add_argument(
+        "--scale", type=int, default=1, help="multiply the repeat counts of the scripts"
+    )
+    arg_parser.add_argument(
+        "--blocks",
+        action="store_true",
+        help="run the hot code translated into Python (see BlockEmulator)",
+    )
+    args = arg_parser.parse_args()
+
+    emulator_class = BlockEmulator if args.blocks else Emulator
+    if not args.inputs[0].endswith(".tst"):
+        emulator = emulator_class(read_program(args.inputs[0]))
+        start = time.perf_counter()
+        cycles = emulator.run(args.cycles)
+        elapsed = time.perf_counter() - start
+        print(
+            "%d instructions in %.3fs, %.0f instructions/s%s"
+            % (
+                cycles,
+                elapsed,
+                cycles / max(elapsed, 1e-9),
+                ", halted" if emulator.halted else "",
+            )
+        )
+        for address in args.ram:
+            print("RAM[%d] = %d" % (address, emulator.ram[address]))
+        return
+
+    program = args.program and read_program(args.program)
+    failed = 0
+    for path in args.inputs:
+        try:
+            failure = TestScript(path, program, args.scale, emulator_class).run()
+        except (ScriptError, ValueError, OSError) as e:
+            failure = str(e)
+        if failure:
+            failed += 1
+            print("%s: %s" % (path, failure))
+        else:
+            print("%s: comparison ended successfully" % path)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 19:10
+#
+# relocatable objects and the linker. An object is one separately assembled
+# source: its words, its labels and the (address, symbol, kind) of every
+# symbolic A-instruction, addresses relative to its start. Linking lays the
+# objects out one after the other and resolves them exactly as the assembler
+# resolves a single source: labels, then predefined symbols, anything else is
+# a variable allocated from 16 in order of first reference
+# (`Class.static.n`...)
+#
+# the kind of a relocation is "label" when the symbol must be a label (a
+# function, a jump target, a return address), linking fails if no object
+# defines it, or "variable" when it may be a variable. Assembled sources only
+# have "variable" relocations, as a single source may use any symbol as one
+#
+# the object file is JSON:
+#   {"version": 1, "name": "Main", "place": null,
+#    "words": <base64 of the little endian words>,
+#    "labels": {"Main.main": 0, ...},
+#    "relocs": [[3, "Main.static.0", "variable"], [7, "Math.multiply", "label"]],
+#    "options": {"compact": false, ...}}
+# `options` are the code generation options of objects translated from VM
+# code (08/VMTranslator.py --objects), null for assembled sources. The
+# calling convention and the shared routines depend on them, so every
+# translated object of a program must have the same options
+import argparse
+import base64
+import json
+import sys
+from array import array
+
+from assembler import Assembler, predefined_symbols, write_hack
+from rom import pack_rom
+
+OBJECT_VERSION = 1
+
+# objects pinned to the start (bootstrap) or the end (shared runtime
+# routines) of the program, the others keep their order in between
+places = {"first": 0, None: 1, "last": 2}
+
+
+class HackObject:
+    def __init__(self, name="", place=None):
+        self.name = name
+        self.place = place
+        self.words = array("H")
+        self.labels = {}
+        self.relocs = []
+        self.options = None
+
+    def save(self, path):
+        words = array("H", self.words)
+        if sys.byteorder == "big":
+            words.byteswap()
+        data = {
+            "version": OBJECT_VERSION,
+            "name": self.name,
+            "place": self.place,
+            "words": base64.b64encode(words.tobytes()).decode(),
+            "labels": self.labels,
+            "relocs": self.relocs,
+            "options": self.options,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def make_object(source, name="", place=None, options=None, is_variable=None):
+    # `is_variable(symbol)` tells the variables from the labels among the
+    # symbols the source refers to, without it they are all "variable"
+    assembler = Assembler()
+    assembler.scan(source.splitlines())
+    assembler.check()
+    obj = HackObject(name, place)
+    obj.options = options
+    obj.words = assembler.program
+    obj.labels = assembler.label_table
+    obj.relocs = [
+        (
+            address,
+            symbol,
+            "variable" if is_variable is None or is_variable(symbol) else "label",
+        )
+        for address, symbol in assembler.fixups
+    ]
+    return obj
+
+
+def load_object(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != OBJECT_VERSION:
+        raise ValueError(f"{path}: unsupported object version {data.get('version')}")
+    obj = HackObject(data["name"], data["place"])
+    obj.words = array("H", base64.b64decode(data["words"]))
+    if sys.byteorder == "big":
+        obj.words.byteswap()
+    obj.labels = data["labels"]
+    # relocations written before their kind was recorded may be variables
+    obj.relocs = [
+        (reloc[0], reloc[1], reloc[2] if len(reloc) > 2 else "variable")
+        for reloc in data["relocs"]
+    ]
+    # objects written before the options were recorded have none
+    obj.options = data.get("options")
+    return obj
+
+
+def check_options(objects):
+    # raises ValueError unless the objects with options all have the same
+    first = None
+    for obj in objects:
+        if obj.options is None:
+            continue
+        if first is None:
+            first = obj
+        elif obj.options != first.options:
+            names = sorted(set(first.options) | set(obj.options))
+            differences = ", ".join(
+                f"{name} {first.options.get(name)} and {obj.options.get(name)}"
+                for name in names
+                if first.options.get(name) != obj.options.get(name)
+            )
+            raise ValueError(
+                f"{first.name} and {obj.name} were translated with different "
+                f"options: {differences}"
+            )
+
+
+def link(objects):
+    # -> the linked program
+    check_options(objects)
+    objects = sorted(objects, key=lambda obj: places[obj.place])
+    assembler = Assembler()
+    defined = {}
+    linked = {}
+    for obj in objects:
+        # the same object twice, e.g. the runtime of separately built parts
+        previous = linked.get(obj.name)
+        if previous is not None and (
+            previous.words == obj.words
+            and previous.labels == obj.labels
+            and previous.relocs == obj.relocs
+        ):
+            continue
+        linked[obj.name] = obj
+        for label in obj.labels:
+            if label in defined:
+                raise ValueError(
+                    f"label {label} defined in both {defined[label]} and {obj.name}"
+                )
+            defined[label] = obj.name
+        fixups = [(address, symbol) for address, symbol, _ in obj.relocs]
+        assembler.link(obj.words, obj.labels, fixups)
+    check_labels(linked.values(), defined)
+    return assembler.resolve_fixups()
+
+
+def check_labels(objects, defined):
+    # raises ValueError naming the labels no object defines, with the objects
+    # referring to them; they would silently become variables otherwise
+    missing = {}
+    for obj in objects:
+        for _, symbol, kind in obj.relocs:
+            if (
+                kind == "label"
+                and symbol not in defined
+                and symbol not in predefined_symbols
+            ):
+                missing.setdefault(symbol, set()).add(obj.name)
+    if missing:
+        raise ValueError(
+            "undefined labels: "
+            + ", ".join(
+                "%s (in %s)" % (symbol, ", ".join(sorted(names)))
+                for symbol, names in sorted(missing.items())
+            )
+        )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Hack linker")
+    arg_parser.add_argument("objects", nargs="+", help="the object files")
+    arg_parser.add_argument(
+        "-o", "--output", help="the output file, standard output by default"
+    )
+    arg_parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="write a packed binary ROM image (see rom.py) instead of .hack text",
+    )
+    args = arg_parser.parse_args()
+
+    try:
+        program = link([load_object(path) for path in args.objects])
+        image = pack_rom(program) if args.binary else None
+    except ValueError as e:
+        raise SystemExit(e)
+    if args.output:
+        output = open(args.output, "wb")
+    else:
+        output = sys.stdout.buffer
+    with output:
+        if args.binary:
+            output.write(image)
+        else:
+            write_hack(output, program)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 10:12
+#
+# packed ROM image: a 12 byte header followed by the program as little endian
+# 16-bit words
+#
+#   magic "HACK" | version (u16) | number of words (u16) | crc32 of the words (u32)
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b"HACK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+# the most words the u16 count of the header can describe
+MAX_WORDS = 0xFFFF
+
+
+def pack_rom(words):
+    words = array("H", words)
+    if len(words) > MAX_WORDS:
+        raise ValueError(
+            f"{len(words)} words do not fit in a ROM image (at most {MAX_WORDS})"
+        )
+    if sys.byteorder == "big":
+        words.byteswap()
+    data = words.tobytes()
+    return HEADER.pack(MAGIC, VERSION, len(words), zlib.crc32(data)) + data
+
+
+def is_rom(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_rom(path, verify=True):
+    # maps the image read-only and returns a memoryview of unsigned shorts over
+    # the mapping, the words are not copied (except on big endian hosts)
+    with open(path, "rb") as f:
+        # an empty file can not be mapped
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            raise ValueError(f"{path}: not a packed Hack ROM image")
+        image = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, size, checksum = HEADER.unpack_from(image)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a packed Hack ROM image")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported ROM image version {version}")
+    if len(image) != HEADER.size + 2 * size:
+        raise ValueError(f"{path}: truncated ROM image")
+
+    data = memoryview(image)[HEADER.size :]
+    if verify and zlib.crc32(data) != checksum:
+        raise ValueError(f"{path}: ROM image checksum mismatch")
+    if sys.byteorder == "big":
+        words = array("H", data.tobytes())
+        words.byteswap()
+        return memoryview(words)
+    return data.cast("H")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 15:02
+#
+# ROM address -> .asm line, enclosing (LABEL) and enclosing VM function, plus
+# the resolved symbol table of the program; saved as JSON
+import json
+from array import array
+
+
+# the "function" of the code of the VM translator's shared runtime routines
+RUNTIME = "__VM"
+
+
+def is_runtime_label(label):
+    # `__VM.call`, `__VM.return`, `__VM.lt$true`... and the bootstrap's
+    # return label `__VM$Sys.init.ret.1`
+    return label.startswith((RUNTIME + ".", RUNTIME + "$"))
+
+
+def is_function_label(label):
+    # the VM translator names functions `Class.name`; its return labels
+    # (`Class.name.ret.n`) and function local labels (`Class.name$label`)
+    # belong to the enclosing function
+    return (
+        "." in label
+        and "$" not in label
+        and ".ret." not in label
+        and not is_runtime_label(label)
+    )
+
+
+class SourceMap:
+    def __init__(self, source=""):
+        self.source = source
+        self.symbols = {}
+        # distinct label names, the per address arrays hold indexes into it
+        # (-1 before the first label)
+        self.labels = []
+        self.lines = array("I")
+        self.label = array("i")
+        self.function = array("i")
+
+    def add_label(self, label):
+        self.labels.append(label)
+        return len(self.labels) - 1
+
+    def lookup(self, address):
+        # -> (line, label, function), the names are None outside any label
+        label = self.label[address]
+        function = self.function[address]
+        return (
+            self.lines[address],
+            self.labels[label] if label >= 0 else None,
+            self.labels[function] if function >= 0 else None,
+        )
+
+    def save(self, path):
+        data = {
+            "source": self.source,
+            "symbols": self.symbols,
+            "labels": self.labels,
+            "lines": self.lines.tolist(),
+            "label": self.label.tolist(),
+            "function": self.function.tolist(),
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def load_source_map(path):
+    with open(path) as f:
+        data = json.load(f)
+    source_map = SourceMap(data["source"])
+    source_map.symbols = data["symbols"]
+    source_map.labels = data["labels"]
+    source_map.lines = array("I", data["lines"])
+    source_map.label = array("i", data["label"])
+    source_map.function = array("i", data["function"])
+    return source_map
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 23:10
+#
+# python3 -m unittest test_linker, from projects/06
+import os
+import sys
+import unittest
+
+from linker import link, make_object
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+main_source = """
+(Main.main)
+@Main.static.0
+M=1
+@Math.abs
+0;JMP
+"""
+
+math_source = """
+(Math.abs)
+@Math.abs
+0;JMP
+"""
+
+
+def is_static(symbol):
+    return ".static." in symbol
+
+
+class LinkTest(unittest.TestCase):
+    def test_link(self):
+        program = link(
+            [
+                make_object(main_source, "Main", is_variable=is_static),
+                make_object(math_source, "Math", is_variable=is_static),
+            ]
+        )
+        # Main.static.0 is the first variable, Math.abs follows Main
+        self.assertEqual(list(program[:5]), [16, 0xEFC8, 4, 0xEA87, 4])
+
+    def test_missing_object(self):
+        with self.assertRaisesRegex(ValueError, r"Math\.abs \(in Main\)"):
+            link([make_object(main_source, "Main", is_variable=is_static)])
+
+    def test_assembled_objects_have_variables(self):
+        # without `is_variable` every undefined symbol may be a variable, as
+        # in a single source
+        program = link([make_object(main_source, "Main")])
+        self.assertEqual(program[0], 16)
+        self.assertEqual(program[2], 17)
+
+    def test_translated_program_missing_a_class(self):
+        sys.path.insert(0, os.path.join(here, "..", "08"))
+        try:
+            from VMTranslator import translate
+        finally:
+            sys.path.pop(0)
+
+        path = os.path.join(here, "..", "08", "FunctionCalls", "StaticsTest")
+        objects = translate(path, bootstrap=True, objects=[])
+        link(objects)
+        objects = [obj for obj in objects if obj.name != "Class1"]
+        with self.assertRaisesRegex(ValueError, r"Class1\.set \(in Sys\)"):
+            link(objects)
+
+
+if __name__ == "__main__":
+    unittest.main()
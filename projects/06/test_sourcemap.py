@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 23:40
+#
+# python3 -m unittest test_sourcemap, from projects/06
+import os
+import sys
+import unittest
+
+from assembler import Assembler, assemble, map_source
+from sourcemap import RUNTIME
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def translate(path, **options):
+    sys.path.insert(0, os.path.join(here, "..", "08"))
+    try:
+        from VMTranslator import translate
+    finally:
+        sys.path.pop(0)
+    return translate(os.path.join(here, "..", "08", path), bootstrap=True, **options)
+
+
+class SourceMapTest(unittest.TestCase):
+    def test_compact_runtime(self):
+        source = translate(
+            "FunctionCalls/FibonacciElement", compact=True, shared_compare=True
+        )
+        assembler = Assembler()
+        assemble(source, assembler=assembler)
+        symbols = assembler.symbol_table
+        source_map = map_source(source.splitlines(), symbols)
+
+        functions = {
+            source_map.lookup(address)[2] for address in range(len(source_map.lines))
+        }
+        self.assertIn(RUNTIME, functions)
+        self.assertFalse([f for f in functions if f and f.startswith("__VM.")])
+        for label in ("__VM.call", "__VM.return", "__VM.lt"):
+            self.assertEqual(source_map.lookup(symbols[label])[2], RUNTIME)
+        for function in ("Main.fibonacci", "Sys.init"):
+            self.assertEqual(source_map.lookup(symbols[function])[2], function)
+
+
+if __name__ == "__main__":
+    unittest.main()
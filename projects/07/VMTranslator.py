@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # 2018-09-05 13:33
+import importlib.util
+import os
+
 import ply.lex as lex
 import ply.yacc as yacc
 
@@ -290,20 +293,29 @@ def p_pop_op(p):
     emitter.emit_pop(p[2], int(p[3]))
 
 
-parser = yacc.yacc()
+def load_parsetab():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.py")
+    spec = importlib.util.spec_from_file_location(__name__ + "_parsetab", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parser = yacc.yacc(debug=False, write_tables=False, tabmodule=load_parsetab())
 
 import sys
 
-if len(sys.argv) != 3:
-    print("usage: VMTranslator.py <input> <output>")
-    sys.exit(1)
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: VMTranslator.py <input> <output>")
+        sys.exit(1)
 
-input_file = sys.argv[1]
-output_file = sys.argv[2]
+    input_file = sys.argv[1]
+    output_file = sys.argv[2]
 
-emitter = Emitter(output_file)
-with open(input_file) as f:
-    data = f.read()
+    emitter = Emitter(output_file)
+    with open(input_file) as f:
+        data = f.read()
 
-parser.parse(data)
-emitter.close()
+    parser.parse(data, lexer=lexer)
+    emitter.close()
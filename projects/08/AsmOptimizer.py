@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 14:20
+#
+# peephole optimizer for the Hack assembly produced by `Emitter`, all rewrites
+# are local to straight-line code (labels are treated as unknown entry points)
+from collections import Counter
+
+
+def split_c(inst):
+    dest, _, rest = inst.rpartition("=")
+    comp, _, jump = rest.partition(";")
+    return dest, comp, jump
+
+
+def is_label(inst):
+    return inst[0] == "("
+
+
+def is_a(inst):
+    return inst[0] == "@"
+
+
+def reads_d(inst):
+    return not is_a(inst) and "D" in split_c(inst)[1]
+
+
+def writes_d(inst):
+    return not is_a(inst) and "D" in split_c(inst)[0]
+
+
+def reads_a(inst):
+    # M in comp or dest addresses memory through A, and a jump goes to A
+    dest, comp, jump = split_c(inst)
+    return bool(jump) or "A" in comp or "M" in comp or "M" in dest
+
+
+def writes_a(inst):
+    return is_a(inst) or "A" in split_c(inst)[0]
+
+
+def is_jump(inst):
+    return not is_a(inst) and ";" in inst
+
+
+def is_unconditional_jump(inst):
+    return is_jump(inst) and split_c(inst)[2] == "JMP"
+
+
+def d_dead_after(insts, i):
+    # whether D is overwritten before being read on every path after insts[i],
+    # anything leaving straight-line code counts as a read
+    for inst in insts[i + 1 :]:
+        if is_label(inst):
+            return False
+        if is_a(inst):
+            continue
+        if reads_d(inst) or is_jump(inst):
+            return False
+        if writes_d(inst):
+            return True
+    return False
+
+
+def a_dead_after(insts, i):
+    for inst in insts[i + 1 :]:
+        if is_label(inst):
+            return False
+        if is_a(inst):
+            return True
+        if reads_a(inst):
+            return False
+        if writes_a(inst):
+            return True
+    return False
+
+
+def parse(text):
+    insts = []
+    for line in text.splitlines():
+        i = line.find("//")
+        if i >= 0:
+            line = line[:i]
+        line = "".join(line.split())
+        if line:
+            insts.append(line)
+    return insts
+
+
+def remove_dead_code(insts, stats):
+    # nothing after an unconditional jump is reachable before the next label
+    out = []
+    dead = False
+    for inst in insts:
+        if is_label(inst):
+            dead = False
+        elif dead:
+            stats["dead code"] += 1
+            continue
+        out.append(inst)
+        if is_unconditional_jump(inst):
+            dead = True
+    return out
+
+
+def remove_jumps_to_next(insts, stats):
+    # `@L` + a jump without dest followed by `(L)` (possibly among other labels)
+    out = []
+    i = 0
+    while i < len(insts):
+        inst = insts[i]
+        if is_a(inst) and i + 1 < len(insts) and is_jump(insts[i + 1]):
+            dest = split_c(insts[i + 1])[0]
+            j = i + 2
+            labels = set()
+            while j < len(insts) and is_label(insts[j]):
+                labels.add(insts[j][1:-1])
+                j += 1
+            if not dest and inst[1:] in labels:
+                stats["jump to next label"] += 2
+                i += 2
+                continue
+        out.append(inst)
+        i += 1
+    return out
+
+
+def collapse_pop_push(insts, stats):
+    # `@SP AM=M-1 D=x @SP AM=M+1 A=A-1 M=D` leaves SP, A, D and memory
+    # exactly as `@SP A=M-1 MD=x`
+    out = []
+    i = 0
+    while i < len(insts):
+        window = insts[i : i + 7]
+        if (
+            len(window) == 7
+            and window[0] == "@SP"
+            and window[1] == "AM=M-1"
+            and window[2].startswith("D=")
+            and ";" not in window[2]
+            and window[3:] == ["@SP", "AM=M+1", "A=A-1", "M=D"]
+        ):
+            out += ["@SP", "A=M-1", "M" + window[2]]
+            stats["pop/push pair"] += 4
+            i += 7
+            continue
+        out.append(insts[i])
+        i += 1
+    return out
+
+
+def propagate_registers(insts, stats):
+    # tracks what A and D are known to hold along straight-line code:
+    # A is "@X" (the value X) or "*X" (RAM[X]), D is a small constant
+    out = []
+    a = d = None
+    i = 0
+    while i < len(insts):
+        inst = insts[i]
+        if is_label(inst):
+            a = d = None
+            out.append(inst)
+            i += 1
+            continue
+
+        if is_a(inst):
+            if a == inst:
+                stats["redundant A load"] += 1
+                i += 1
+                continue
+            if a == "*" + inst[1:] and i + 1 < len(insts) and insts[i + 1] == "A=M":
+                stats["redundant A load"] += 2
+                i += 2
+                continue
+            # `@0 D=A`, `@1 D=A` and `@1 D=-A` become `D=0`, `D=1`, `D=-1`
+            if (
+                inst in ("@0", "@1")
+                and i + 1 < len(insts)
+                and insts[i + 1] in ("D=A", "D=-A")
+                and a_dead_after(insts, i + 1)
+            ):
+                value = int(inst[1:]) * (-1 if insts[i + 1] == "D=-A" else 1)
+                out.append("D=%d" % value)
+                stats["constant load"] += 1
+                d = value
+                i += 2
+                continue
+            out.append(inst)
+            a = inst
+            i += 1
+            continue
+
+        dest, comp, jump = split_c(inst)
+        if inst == "M=D" and d is not None:
+            inst = "M=%d" % d
+        out.append(inst)
+
+        if inst == "A=M" and a is not None and a[0] == "@":
+            a = "*" + a[1:]
+        elif "A" in dest:
+            a = None
+        elif "M" in dest and a is not None and a[0] == "*":
+            # the write may alias the cell A was loaded from
+            a = None
+        if "D" in dest:
+            if comp in ("0", "1", "-1"):
+                d = int(comp)
+            elif comp == "A" and a in ("@0", "@1"):
+                d = int(a[1:])
+            else:
+                d = None
+        i += 1
+    return out
+
+
+def remove_dead_stores(insts, stats):
+    # `D=x` whose value is never read, `@X` whose value is never used
+    out = []
+    for i, inst in enumerate(insts):
+        if is_a(inst):
+            if i + 1 < len(insts) and is_a(insts[i + 1]):
+                stats["dead store"] += 1
+                continue
+        elif not is_label(inst):
+            dest, comp, jump = split_c(inst)
+            if dest == "D" and not jump and d_dead_after(insts, i):
+                stats["dead store"] += 1
+                continue
+        out.append(inst)
+    return out
+
+
+passes = [
+    remove_dead_code,
+    remove_jumps_to_next,
+    collapse_pop_push,
+    propagate_registers,
+    remove_dead_stores,
+]
+
+
+def count_instructions(insts):
+    return sum(1 for inst in insts if not is_label(inst))
+
+
+def optimize(text):
+    # -> (optimized text, stats), stats counts the instructions removed by
+    # each rewrite plus the instruction counts before and after
+    insts = parse(text)
+    stats = Counter()
+    before = count_instructions(insts)
+    while True:
+        size = count_instructions(insts)
+        for p in passes:
+            insts = p(insts, stats)
+        if count_instructions(insts) == size:
+            break
+    stats["before"] = before
+    stats["after"] = count_instructions(insts)
+    return "\n".join(insts) + "\n", stats
+
+
+def report(stats):
+    before, after = stats["before"], stats["after"]
+    lines = [
+        "instructions: %d -> %d (%d saved, %.1f%%)"
+        % (before, after, before - after, 100 * (before - after) / max(before, 1))
+    ]
+    for name, count in sorted(stats.items()):
+        if name not in ("before", "after") and count:
+            lines.append("  %-20s %d" % (name, count))
+    return "\n".join(lines)
+
+
+import sys
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: AsmOptimizer.py <input.asm> <output.asm>")
+        sys.exit(1)
+    with open(sys.argv[1]) as f:
+        text, stats = optimize(f.read())
+    with open(sys.argv[2], "w") as f:
+        f.write(text)
+    print(report(stats))
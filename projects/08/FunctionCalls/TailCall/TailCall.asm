@@ -0,0 +1,417 @@
+
+@256
+D=A
+@SP
+M=D
+        
+// call
+        
+@0
+D=A
+@SP
+D=M-D
+@new_arg
+M=D
+        
+@__VM$Sys.init.ret.1
+D=A
+@SP
+AM=M+1
+A=A-1
+M=D
+
+        
+@LCL
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@ARG
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@THIS
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@THAT
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+        
+@SP
+D=M
+@LCL
+M=D
+@new_arg
+D=M
+@ARG
+M=D
+        
+@Sys.init
+0;JMP
+        
+(__VM$Sys.init.ret.1)
+        
+// function
+(Point.getX)
+D=0
+        @ARG
+A=M
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THIS
+M=D
+
+// tail call
+        
+@LCL
+D=M
+@1
+A=D-A
+D=M
+@frame_that
+M=D
+            
+@LCL
+D=M
+@2
+A=D-A
+D=M
+@frame_this
+M=D
+            
+@LCL
+D=M
+@3
+A=D-A
+D=M
+@frame_arg
+M=D
+            
+@LCL
+D=M
+@4
+A=D-A
+D=M
+@frame_lcl
+M=D
+            
+@LCL
+D=M
+@5
+A=D-A
+D=M
+@frame_ret_addr
+M=D
+            
+@ARG
+D=M
+@0
+D=D+A
+@SP
+M=D
+        
+@frame_ret_addr
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+            
+@frame_lcl
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+            
+@frame_arg
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+            
+@frame_this
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+            
+@frame_that
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+            
+@SP
+D=M
+@LCL
+M=D
+@Point.x
+0;JMP
+        
+// function
+(Point.x)
+D=0
+        @THIS
+A=M
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+// return
+        
+@LCL
+D=M
+@5
+A=D-A
+D=M
+@ret_addr
+M=D
+
+@ARG
+D=M
+@old_arg
+M=D
+        
+@SP
+AM=M-1
+D=M
+
+@ARG
+A=M
+M=D
+        
+@LCL
+D=M
+@SP
+M=D
+        
+@SP
+AM=M-1
+D=M
+
+@THAT
+M=D
+@SP
+AM=M-1
+D=M
+
+@THIS
+M=D
+@SP
+AM=M-1
+D=M
+
+@ARG
+M=D
+@SP
+AM=M-1
+D=M
+
+@LCL
+M=D
+        
+@old_arg
+D=M+1
+@SP
+M=D
+        
+@ret_addr
+A=M
+0;JMP
+        
+// function
+(Sys.init)
+D=0
+        
+@3010
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THAT
+M=D
+
+@2000
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THAT
+A=M
+M=D
+
+@3000
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THIS
+M=D
+
+@1000
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THIS
+A=M
+M=D
+
+@4000
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@THAT
+M=D
+
+@3010
+D=A
+            @SP
+AM=M+1
+A=A-1
+M=D
+
+// call
+        
+@1
+D=A
+@SP
+D=M-D
+@new_arg
+M=D
+        
+@Sys$Point.getX.ret.1
+D=A
+@SP
+AM=M+1
+A=A-1
+M=D
+
+        
+@LCL
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@ARG
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@THIS
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+@THAT
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+
+        
+@SP
+D=M
+@LCL
+M=D
+@new_arg
+D=M
+@ARG
+M=D
+        
+@Point.getX
+0;JMP
+        
+(Sys$Point.getX.ret.1)
+        @SP
+AM=M-1
+D=M
+@5
+M=D
+@THIS
+A=M
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@6
+M=D
+@THAT
+D=M
+@SP
+AM=M+1
+A=A-1
+M=D
+@SP
+AM=M-1
+D=M
+@7
+M=D
+
+(Sys.init$END)
+        
+@Sys.init$END
+0;JMP
+        
\ No newline at end of file
@@ -0,0 +1,16 @@
+// Tests VMTranslator.py --tail-calls: a tail call passes on the THIS and
+// THAT of the function making it, as a plain call does.
+// File name: projects/08/FunctionCalls/TailCall/TailCall.tst
+
+load TailCall.asm,
+output-file TailCall.out,
+compare-to TailCall.cmp,
+output-list RAM[0]%D1.6.1 RAM[5]%D1.6.1 RAM[6]%D1.6.1 RAM[7]%D1.6.1;
+
+set RAM[0] 256,
+
+repeat 1000 {
+  ticktock;
+}
+
+output;
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 17:25
+#
+# optimizer for the VM command tuples of `VMTranslator.parse_commands`, run
+# before the `Emitter`. Besides the VM commands it produces:
+#   ("push", "constant", n)   with any 16 bit n, negative ones included
+#   ("move", segment, index, segment, index)
+#                             push + pop without going through the stack
+#   ("if-not-goto", label)    not + if-goto: jumps unless the value is -1
+#   ("if-zero-goto", label)   jumps if the value is 0
+#   ("push"/"pop", "inline", n)
+#                             the scratch variables `__VM.inline.n` holding the
+#                             arguments and locals of an inlined function
+from collections import Counter
+
+binary = {
+    "add": lambda x, y: x + y,
+    "sub": lambda x, y: x - y,
+    "and": lambda x, y: x & y,
+    "or": lambda x, y: x | y,
+    # as computed by the emitted code: on the sign of the wrapped x - y
+    "eq": lambda x, y: -(x == y),
+    "lt": lambda x, y: -(wrap(x - y) < 0),
+    "gt": lambda x, y: -(wrap(x - y) > 0),
+}
+
+unary = {"neg": lambda x: -x, "not": lambda x: ~x}
+
+
+def wrap(value):
+    # to a signed 16 bit value
+    return (value + 0x8000 & 0xFFFF) - 0x8000
+
+
+def constant(command):
+    # -> the value pushed by `push constant`, None for anything else
+    if command[0] == "push" and command[1] == "constant":
+        return command[2]
+    return None
+
+
+def fold_constants(commands, stats):
+    # `push constant a; push constant b; add` and `push constant a; neg`
+    out = []
+    for command in commands:
+        op = command[0]
+        if op in binary and len(out) >= 2:
+            x, y = constant(out[-2]), constant(out[-1])
+            if x is not None and y is not None:
+                out[-2:] = [("push", "constant", wrap(binary[op](x, y)))]
+                stats["constant folding"] += 2
+                continue
+        if op in unary and out:
+            x = constant(out[-1])
+            if x is not None:
+                out[-1] = ("push", "constant", wrap(unary[op](x)))
+                stats["constant folding"] += 1
+                continue
+        out.append(command)
+    return out
+
+
+def remove_double_unary(commands, stats):
+    # `not; not` and `neg; neg`
+    out = []
+    for command in commands:
+        if command[0] in unary and out and out[-1] == command:
+            out.pop()
+            stats["double negation"] += 2
+            continue
+        out.append(command)
+    return out
+
+
+def push_pop_to_move(commands, stats):
+    out = []
+    for command in commands:
+        if command[0] == "pop" and out and out[-1][0] == "push":
+            push = out.pop()
+            if push[1:] != command[1:]:
+                out.append(("move",) + push[1:] + command[1:])
+            stats["push/pop to move"] += 1
+            continue
+        out.append(command)
+    return out
+
+
+def invert_branches(commands, stats):
+    # `not; if-goto L` -> `if-not-goto L`
+    # `if-goto T; goto F; label T` -> `if-zero-goto F; label T`
+    out = []
+    for command in commands:
+        if command[0] == "if-goto" and out and out[-1] == ("not",):
+            out[-1] = ("if-not-goto", command[1])
+            stats["inverted branch"] += 1
+            continue
+        if (
+            command[0] == "label"
+            and len(out) >= 2
+            and out[-2] == ("if-goto", command[1])
+            and out[-1][0] == "goto"
+        ):
+            out[-2:] = [("if-zero-goto", out[-1][1])]
+            stats["inverted branch"] += 1
+        out.append(command)
+    return out
+
+
+passes = [fold_constants, remove_double_unary, push_pop_to_move, invert_branches]
+
+
+def optimize(commands, stats=None):
+    # -> the optimized commands, `stats` (a Counter) counts the commands
+    # removed or rewritten by each pass plus the command counts before and
+    # after
+    if stats is None:
+        stats = Counter()
+    stats["before"] += len(commands)
+    while True:
+        size = len(commands)
+        for p in passes:
+            commands = p(commands, stats)
+        if len(commands) == size:
+            break
+    stats["after"] += len(commands)
+    return commands
+
+
+def remove_dead_functions(units, dropped=None, root="Sys.init"):
+    # whole program: [(class, commands)] -> the same without the functions
+    # no chain of calls from `root` reaches. Every dropped function is
+    # appended to `dropped` as [name, number of commands]. Without `root`
+    # nothing is known to be dead
+    calls = {}
+    for _, commands in units:
+        function = None
+        for command in commands:
+            if command[0] == "function":
+                function = command[1]
+                calls[function] = set()
+            elif command[0] == "call" and function is not None:
+                calls[function].add(command[1])
+    if root not in calls:
+        return units
+
+    live = set()
+    todo = [root]
+    while todo:
+        function = todo.pop()
+        if function not in live:
+            live.add(function)
+            todo += calls.get(function, ())
+
+    out = []
+    for clazz, commands in units:
+        kept = []
+        function = None
+        for command in commands:
+            if command[0] == "function":
+                function = command[1]
+                if function not in live and dropped is not None:
+                    dropped.append([function, 0])
+            if function is None or function in live:
+                kept.append(command)
+            elif dropped is not None:
+                dropped[-1][1] += 1
+        out.append((clazz, kept))
+    return out
+
+
+# stack effect of the commands allowed in an inlined body
+stack_effects = dict.fromkeys(binary, -1)
+stack_effects.update(dict.fromkeys(unary, 0))
+stack_effects.update({"push": 1, "pop": -1})
+
+
+def inline_body(commands):
+    # the commands of a function from its `function` to its `return` -> the
+    # body to inline, None unless it is straight line code without calls
+    # that leaves just its result on the stack
+    body = commands[1:-1]
+    if commands[-1] != ("return",):
+        return None
+    depth = 0
+    for command in body:
+        if command[0] not in stack_effects:
+            return None
+        depth += stack_effects[command[0]]
+        if depth < 0:
+            return None
+    if depth != 1:
+        return None
+    return body
+
+
+def expand_call(body, n_arg, n_local):
+    # -> the commands replacing `call` with `body`: the arguments and locals
+    # live in the inline segment, THIS and THAT are put back if the body
+    # moves them as the return of the function would
+    used = {command[1:] for command in body if len(command) == 3}
+    if any(
+        memory == "argument" and index >= n_arg or memory == "local" and index >= n_local
+        for memory, index in used
+    ):
+        return None
+    saved = [i for i in range(2) if ("pointer", i) in used]
+    out = [("pop", "inline", i) for i in reversed(range(n_arg))]
+    for i in range(n_local):
+        out += [("push", "constant", 0), ("pop", "inline", n_arg + i)]
+    for i, pointer in enumerate(saved):
+        out += [("push", "pointer", pointer), ("pop", "inline", n_arg + n_local + i)]
+    for command in body:
+        if len(command) == 3 and command[1] == "argument":
+            command = (command[0], "inline", command[2])
+        elif len(command) == 3 and command[1] == "local":
+            command = (command[0], "inline", n_arg + command[2])
+        out.append(command)
+    for i, pointer in enumerate(saved):
+        out += [("push", "inline", n_arg + n_local + i), ("pop", "pointer", pointer)]
+    return out
+
+
+def inline_functions(units, inlined=None, max_size=8, budget=None):
+    # whole program: [(class, commands)] -> the same with the calls of the
+    # small leaf functions (at most `max_size` commands between `function`
+    # and `return`) replaced by their bodies. The VM commands added, calls
+    # removed, stay within `budget` (by default a tenth of the program, at
+    # least 100).
+    # Functions using static are only inlined into their own class. Every
+    # inlined call counts in `inlined` (a Counter) under its function
+    functions = {}
+    for clazz, commands in units:
+        start = None
+        for i, command in enumerate(commands + [("function", None, 0)]):
+            if command[0] != "function":
+                continue
+            if start is not None and commands[start][1] not in functions:
+                body = inline_body(commands[start:i])
+                if body is not None and len(body) <= max_size:
+                    functions[commands[start][1]] = (clazz, commands[start][2], body)
+            start = i
+    if budget is None:
+        budget = max(sum(len(commands) for _, commands in units) // 10, 100)
+
+    out = []
+    for clazz, commands in units:
+        expanded = []
+        for command in commands:
+            callee = functions.get(command[1]) if command[0] == "call" else None
+            if callee is not None and (
+                callee[0] == clazz
+                or all(part[1:2] != ("static",) for part in callee[2])
+            ):
+                inline = expand_call(callee[2], command[2], callee[1])
+                if inline is not None and len(inline) - 1 <= budget:
+                    budget -= len(inline) - 1
+                    expanded += inline
+                    if inlined is not None:
+                        inlined[command[1]] += 1
+                    continue
+            expanded.append(command)
+        out.append((clazz, expanded))
+    return out
+
+
+def report(stats):
+    before, after = stats["before"], stats["after"]
+    lines = [
+        "VM commands: %d -> %d (%d saved, %.1f%%)"
+        % (before, after, before - after, 100 * (before - after) / max(before, 1))
+    ]
+    for name, count in sorted(stats.items()):
+        if name not in ("before", "after") and count:
+            lines.append("  %-20s %d" % (name, count))
+    return "\n".join(lines)
+
+
+def report_inlined(inlined):
+    lines = [
+        "inlined calls: %d (%d functions)" % (sum(inlined.values()), len(inlined))
+    ]
+    for function, count in sorted(inlined.items()):
+        lines.append("  %-30s %d" % (function, count))
+    return "\n".join(lines)
+
+
+def report_dead_functions(dropped):
+    lines = [
+        "dead functions: %d (%d VM commands)"
+        % (len(dropped), sum(size for _, size in dropped))
+    ]
+    for function, size in sorted(dropped):
+        lines.append("  %-30s %d" % (function, size))
+    return "\n".join(lines)
+
+
+import sys
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: VMOptimizer.py <input.vm>")
+        sys.exit(1)
+    from VMTranslator import lexer, parse_commands
+
+    with open(sys.argv[1]) as f:
+        commands = parse_commands(f.read(), lexer.clone())
+    stats = Counter()
+    for command in optimize(commands, stats):
+        print(" ".join(str(field) for field in command))
+    print(report(stats), file=sys.stderr)
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # 2018-09-05 13:33
+import glob
+import hashlib
+import importlib.util
+import os
+import pickle
+from collections import Counter
+from itertools import repeat
+
 import ply.lex as lex
 import ply.yacc as yacc
 
+import VMOptimizer
+
 reserved = {
     "push",
     "pop",
@@ -67,6 +77,17 @@ lexer = lex.lex()
 #         break
 #     print(tok)
 
+# where a tail call keeps the frame it passes on (ret_addr, LCL, ARG, THIS,
+# THAT) while it builds the callee's
+frame_variables = (
+    "frame_ret_addr",
+    "frame_lcl",
+    "frame_arg",
+    "frame_this",
+    "frame_that",
+)
+
+
 # emitter
 class Emitter:
     snippet_pop_a = "@SP\nAM=M-1\n"
@@ -75,13 +96,75 @@ class Emitter:
 
     snippet_push_d = "@SP\nAM=M+1\nA=A-1\nM=D\n"
 
-    def __init__(self, output):
-        self.output = open(output, "w")
+    memories = {"local": "LCL", "argument": "ARG", "this": "THIS", "that": "THAT"}
+
+    def __init__(
+        self,
+        sink=None,
+        compact=False,
+        shared_compare=False,
+        cache_tos=False,
+        tail_calls=False,
+    ):
+        # the sink is a list collecting the chunks or anything with `write`
+        # (StringIO, an open file); the default is a new list
+        self.sink = [] if sink is None else sink
+        if isinstance(self.sink, list):
+            self.write = self.sink.append
+        else:
+            self.write = self.sink.write
+        self.bool_index = 0
+        self.call_index = 0
+        # the class names the statics of the .vm file being translated, the
+        # function scopes its branch labels
+        self.clazz = ""
+        self.function = ""
+        # the labels made up by the translator are numbered per class and
+        # prefixed with it, so they only depend on the file itself
+        self.label_prefix = "__VM$"
+        # compact mode: call sites and returns jump to routines shared by the
+        # whole program (`__VM.call`...), emitted once after all the code by
+        # `emit_routines`
+        self.compact = compact
+        # eq, lt and gt jump to one routine per operator (`__VM.eq`...)
+        self.shared_compare = shared_compare
+        self.routines = set()
+        # top of stack caching: while `tos_in_d` is set the top of stack is in
+        # D instead of RAM[SP-1] (SP does not count it). It is written back by
+        # `flush` wherever control flow may join or leave
+        self.cache_tos = cache_tos
+        self.tos_in_d = False
+        # a call directly followed by return reuses the frame of the caller
+        self.tail_calls = tail_calls
+        # instructions saved by `cheapest`, as "push local"...
+        self.addressing = Counter()
+
+    def flush(self):
+        if self.tos_in_d:
+            self.tos_in_d = False
+            self.emit_inst(self.snippet_push_d)
+
+    def pop_tos(self):
+        # -> the code popping the top of stack into D
+        if self.tos_in_d:
+            self.tos_in_d = False
+            return ""
+        return self.snippet_pop_d
+
+    def set_class(self, clazz):
+        self.flush()
+        self.clazz = clazz
+        self.function = ""
+        self.label_prefix = f"{clazz}$"
         self.bool_index = 0
         self.call_index = 0
 
-    def close(self):
-        self.output.close()
+    def scoped_label(self, label):
+        # `function$label` as in the VM spec, so the compiler's per function
+        # labels (WHILE_EXP0...) never clash across functions and classes
+        if self.function:
+            return f"{self.function}${label}"
+        return label
 
     def bootstrap(self):
         inst = """
@@ -94,7 +177,7 @@ M=D
         self.emit_call("Sys.init", 0)
 
     def emit_inst(self, inst):
-        self.output.write(inst)
+        self.write(inst)
 
     def emit_function(self, function, n_local):
         # before the function:
@@ -105,6 +188,8 @@ M=D
         # 1. declare function symbol
         # 2. reserve local (with n_args)
         #
+        self.flush()
+        self.function = function
         inst = f"""
 // function
 ({function})
@@ -116,6 +201,19 @@ D=0
         self.emit_inst(inst)
 
     def emit_return(self):
+        self.flush()
+        if not self.compact:
+            self.emit_inst(self.return_routine())
+            return
+        self.routines.add("return")
+        inst = """
+// return
+@__VM.return
+0;JMP
+        """
+        self.emit_inst(inst)
+
+    def return_routine(self):
         # return:
         # 1. save ret_addr and old arg
         # 2. pop ret to *arg
@@ -123,7 +221,7 @@ D=0
         # 4. pop and restore THAT, THIS, ARG, LCL
         # 5. set sp to old arg
         # 6. jump to ret_addr
-        inst = f"""
+        inst = """
 // return
         """
         # save ret_addr and old arg
@@ -183,9 +281,13 @@ M=D
 A=M
 0;JMP
         """
-        self.emit_inst(inst)
+        return inst
 
     def emit_call(self, label, n_arg):
+        self.flush()
+        if self.compact:
+            self.emit_compact_call(label, n_arg)
+            return
         # 1. save new_arg
         # 2. push ret_addr
         # 3. push LCL, ARG, THIS, THAT
@@ -208,7 +310,7 @@ M=D
         self.call_index += 1
 
         inst += f"""
-@{label}.ret.{self.call_index}
+@{self.label_prefix}{label}.ret.{self.call_index}
 D=A
 {self.snippet_push_d}
         """
@@ -245,34 +347,267 @@ M=D
         """
         # 6. define reg_addr label
         inst += f"""
-({label}.ret.{self.call_index})
+({self.label_prefix}{label}.ret.{self.call_index})
         """
 
         self.emit_inst(inst)
 
-    def emit_goto(self, label):
+    def emit_compact_call(self, label, n_arg):
+        # target in R13, n_arg in R14, return address in D
+        self.routines.add("call")
+        self.call_index += 1
         inst = f"""
+// call
+@{label}
+D=A
+@R13
+M=D
+@{n_arg}
+D=A
+@R14
+M=D
+@{self.label_prefix}{label}.ret.{self.call_index}
+D=A
+@__VM.call
+0;JMP
+({self.label_prefix}{label}.ret.{self.call_index})
+        """
+        self.emit_inst(inst)
+
+    def emit_tail_call(self, label, n_arg):
+        # 1. load the saved frame (ret_addr, LCL, ARG, THIS, THAT) into the
+        #    frame_* scratch variables, the callee saves it as its own frame.
+        #    THIS and THAT are left alone: the callee starts with ours, as
+        #    after a plain call
+        # 2. move the arguments down to ARG
+        # 3. push the frame above them, LCL=SP
+        # 4. jump to label, its return goes straight to our caller
+        self.flush()
+        # move the arguments down, the lowest first: they never overlap what
+        # is still to be read
+        move_args = ""
+        for i in range(n_arg):
+            increments = "A=A+1\n" * i
+            move_args += f"""
+@SP
+D=M
+@{n_arg - i}
+A=D-A
+D=M
+@ARG
+A=M
+{increments}M=D
+            """
+
+        inst = """
+// tail call
+        """
+        # 1. load the saved frame
+        for offset, dest in enumerate(reversed(frame_variables), 1):
+            inst += f"""
+@LCL
+D=M
+@{offset}
+A=D-A
+D=M
+@{dest}
+M=D
+            """
+        # 2. move the arguments down
+        inst += move_args
+        # 3. push the frame, LCL=SP
+        inst += f"""
+@ARG
+D=M
+@{n_arg}
+D=D+A
+@SP
+M=D
+        """
+        for src in frame_variables:
+            inst += f"""
+@{src}
+D=M
+{self.snippet_push_d}
+            """
+        # 4. jump to label
+        inst += f"""
+@SP
+D=M
+@LCL
+M=D
 @{label}
+0;JMP
+        """
+        self.emit_inst(inst)
+
+    def call_routine(self):
+        # the steps of `emit_call` with the frame pushed first: ARG is then
+        # SP - 5 - n_arg
+        inst = f"""
+(__VM.call)
+{self.snippet_push_d}
+@LCL
+D=M
+{self.snippet_push_d}
+@ARG
+D=M
+{self.snippet_push_d}
+@THIS
+D=M
+{self.snippet_push_d}
+@THAT
+D=M
+{self.snippet_push_d}
+@R14
+D=M
+@5
+D=D+A
+@SP
+D=M-D
+@ARG
+M=D
+@SP
+D=M
+@LCL
+M=D
+@R13
+A=M
+0;JMP
+        """
+        return inst
+
+    def compare_routine(self, op):
+        # return address in D, the operands are replaced on the stack by the
+        # result: 16 instructions once and 4 per comparison instead of 18, for
+        # 3 (true) or 4 (false) more cycles per comparison
+        inst = f"""
+(__VM.{op})
+@R15
+M=D
+@SP
+AM=M-1
+D=M
+A=A-1
+D=M-D
+M=-1
+@__VM.{op}$true
+D;J{op.upper()}
+@SP
+A=M-1
+M=0
+(__VM.{op}$true)
+@R15
+A=M
+0;JMP
+        """
+        return inst
+
+    def enable_routines(self):
+        # every shared routine of the enabled modes, for a runtime linked with
+        # classes translated separately
+        if self.compact:
+            self.routines |= {"call", "return"}
+        if self.shared_compare:
+            self.routines |= {"eq", "lt", "gt"}
+
+    def emit_routines(self):
+        self.flush()
+        if self.routines:
+            # code running off the end must not fall into the routines
+            inst = """
+(__VM.end)
+@__VM.end
+0;JMP
+            """
+            self.emit_inst(inst)
+        for op in ("eq", "lt", "gt"):
+            if op in self.routines:
+                self.emit_inst(self.compare_routine(op))
+        if "call" in self.routines:
+            self.emit_inst(self.call_routine())
+        if "return" in self.routines:
+            self.emit_inst("\n(__VM.return)\n" + self.return_routine())
+
+    def emit_commands(self, commands):
+        tail_call = False
+        for i, (op, *args) in enumerate(commands):
+            if tail_call:
+                # the return of the tail call
+                tail_call = False
+                continue
+            if (
+                op == "call"
+                and self.tail_calls
+                and i + 1 < len(commands)
+                and commands[i + 1] == ("return",)
+            ):
+                tail_call = True
+                self.emit_tail_call(*args)
+            elif op in ("eq", "lt", "gt"):
+                self.emit_bool(op)
+            elif op in ("neg", "not"):
+                self.emit_unary(op)
+            elif op in ("add", "sub", "and", "or"):
+                self.emit_binary(op)
+            else:
+                getattr(self, "emit_" + op.replace("-", "_"))(*args)
+
+    def emit_goto(self, label):
+        self.flush()
+        inst = f"""
+@{self.scoped_label(label)}
 0;JMP
         """
         self.emit_inst(inst)
 
     def emit_if_goto(self, label):
         inst = f"""
-{self.snippet_pop_d}
-@{label}
+{self.pop_tos()}
+@{self.scoped_label(label)}
+D;JNE
+        """
+        self.emit_inst(inst)
+
+    def emit_if_not_goto(self, label):
+        # not + if-goto: jumps unless the value is true (-1)
+        inst = f"""
+{self.pop_tos()}
+D=D+1
+@{self.scoped_label(label)}
 D;JNE
         """
         self.emit_inst(inst)
 
+    def emit_if_zero_goto(self, label):
+        inst = f"""
+{self.pop_tos()}
+@{self.scoped_label(label)}
+D;JEQ
+        """
+        self.emit_inst(inst)
+
     def emit_label(self, label):
+        self.flush()
         inst = f"""
-({label})
+({self.scoped_label(label)})
         """
         self.emit_inst(inst)
 
     def emit_bool(self, op):
         self.bool_index += 1
+        if self.shared_compare:
+            self.flush()
+            self.routines.add(op)
+            inst = f"""
+@{self.label_prefix}BOOL_RET_{self.bool_index}
+D=A
+@__VM.{op}
+0;JMP
+({self.label_prefix}BOOL_RET_{self.bool_index})
+            """
+            self.emit_inst(inst)
+            return
         if op == "eq":
             op = "D;JEQ"
         elif op == "lt":
@@ -280,20 +615,39 @@ D;JNE
         elif op == "gt":
             op = "D;JGT"
 
+        if self.cache_tos:
+            # both paths leave the result in D
+            inst = f"""
+{self.pop_tos()}
+{self.snippet_pop_a}
+D=M-D
+@{self.label_prefix}BOOL_TRUE_{self.bool_index}
+{op}
+D=0
+@{self.label_prefix}BOOL_END_{self.bool_index}
+0;JMP
+({self.label_prefix}BOOL_TRUE_{self.bool_index})
+D=-1
+({self.label_prefix}BOOL_END_{self.bool_index})
+            """
+            self.tos_in_d = True
+            self.emit_inst(inst)
+            return
+
         inst = f"""
 {self.snippet_pop_d}
 {self.snippet_pop_a}
 D=M-D
-@BOOL_TRUE_{self.bool_index}
+@{self.label_prefix}BOOL_TRUE_{self.bool_index}
 {op}
 @0
 D=A
-@BOOL_END_{self.bool_index}
+@{self.label_prefix}BOOL_END_{self.bool_index}
 0;JMP
-(BOOL_TRUE_{self.bool_index})
+({self.label_prefix}BOOL_TRUE_{self.bool_index})
 @1
 D=-A
-(BOOL_END_{self.bool_index})
+({self.label_prefix}BOOL_END_{self.bool_index})
 {self.snippet_push_d}
         """
         self.emit_inst(inst)
@@ -303,6 +657,9 @@ D=-A
             op = "!"
         else:
             op = "-"
+        if self.tos_in_d:
+            self.emit_inst(f"D={op}D\n")
+            return
         inst = f"""
 @SP
 A=M-1
@@ -314,6 +671,16 @@ M={op}M
         # pop a, pop b, push (a+b)
         op = {"add": "D=D+M", "sub": "D=M-D", "and": "D=D&M", "or": "D=D|M"}[op]
 
+        if self.cache_tos:
+            inst = f"""
+{self.pop_tos()}
+{self.snippet_pop_a}
+{op}
+            """
+            self.tos_in_d = True
+            self.emit_inst(inst)
+            return
+
         inst = f"""
 {self.snippet_pop_d}
 {self.snippet_pop_a}
@@ -322,102 +689,111 @@ M={op}M
         """
         self.emit_inst(inst)
 
-    def emit_push(self, memory, num):
-        # *sp=*(memory+num); sp++
-        memories = {"local": "LCL", "argument": "ARG", "this": "THIS", "that": "THAT"}
-        if memory in memories:
-            inst = f"""
-@{num}
-D=A
-@{memories[memory]}
-A=D+M
-D=M
-{self.snippet_push_d}
-        """
-        elif memory == "static":
-            global clazz
-            inst = f"""
-@{clazz}.static.{num}
-D=M
-{self.snippet_push_d}
-            """
-        elif memory == "pointer":
+    def segment_address(self, memory, num):
+        # -> the code pointing A at memory+num without touching D: the fixed
+        # addresses of temp, pointer and static, `@SEG A=M` or `@SEG A=M+1`
+        # and one more A=A+1 per offset for the segments
+        if memory in self.memories:
             if num == 0:
-                dest = "THIS"
-            else:
-                dest = "THAT"
-            inst = f"""
-@{dest}
-D=M
-{self.snippet_push_d}
-            """
+                return f"@{self.memories[memory]}\nA=M\n"
+            return f"@{self.memories[memory]}\nA=M+1\n" + "A=A+1\n" * (num - 1)
         elif memory == "temp":
-            inst = f"""
-
-@{num}
-D=A
-@5
-A=D+A
-D=M
-{self.snippet_push_d}
-            """
-        elif memory == "constant":
-            inst = f"""
+            return f"@{5 + num}\n"
+        elif memory == "pointer":
+            return "@THIS\n" if num == 0 else "@THAT\n"
+        elif memory == "static":
+            return f"@{self.clazz}.static.{num}\n"
+        elif memory == "inline":
+            # the arguments and locals of the inlined functions
+            return f"@__VM.inline.{num}\n"
+
+    def general_address(self, memory, num, dest):
+        # dest=memory+num for any offset, through D
+        if memory == "temp":
+            return f"@{num}\nD=A\n@5\n{dest}=D+A\n"
+        return f"@{num}\nD=A\n@{self.memories[memory]}\n{dest}=D+M\n"
+
+    def cheapest(self, access, memory, direct, general):
+        # -> the shorter of the direct sequence and the general one (built by
+        # `general`, only segments and temp have one); the instructions saved
+        # over the general one are counted in `addressing` per access and
+        # segment
+        if memory not in self.memories and memory != "temp":
+            return direct
+        general_inst = general()
+        saved = len(general_inst.split()) - len(direct.split())
+        if saved < 0:
+            return general_inst
+        self.addressing[f"{access} {memory}"] += saved
+        return direct
+
+    def load_d(self, memory, num):
+        # D=*(memory+num)
+        if memory == "constant":
+            # the VM optimizer pushes any 16 bit value
+            if num in (0, 1, -1):
+                return f"D={num}\n"
+            elif num == -32768:
+                return "@32767\nD=-A\nD=D-1\n"
+            elif num < 0:
+                return f"""
+@{-num}
+D=-A
+                """
+            return f"""
 @{num}
 D=A
-{self.snippet_push_d}
             """
-        self.emit_inst(inst)
-
-    def emit_pop(self, memory, num):
-        # sp--; *(memory+num)= *sp
-        memories = {"local": "LCL", "argument": "ARG", "this": "THIS", "that": "THAT"}
-        if memory in memories:
-            inst = f"""
-@{num}
-D=A
-@{memories[memory]}
-D=D+M
-@R13
-M=D
+        return self.cheapest(
+            "push",
+            memory,
+            self.segment_address(memory, num) + "D=M\n",
+            lambda: self.general_address(memory, num, "A") + "D=M\n",
+        )
+
+    def store_d(self, memory, num):
+        # *(memory+num)=D, the general sequence goes through R13 (value) and
+        # R14 (address)
+        return self.cheapest(
+            "pop",
+            memory,
+            self.segment_address(memory, num) + "M=D\n",
+            lambda: "@R13\nM=D\n"
+            + self.general_address(memory, num, "D")
+            + "@R14\nM=D\n@R13\nD=M\n@R14\nA=M\nM=D\n",
+        )
 
-{self.snippet_pop_d}
-@R13
-A=M
-M=D
-            """
+    def emit_push(self, memory, num):
+        # *sp=*(memory+num); sp++
+        self.flush()
+        inst = self.load_d(memory, num)
+        if self.cache_tos:
+            self.tos_in_d = True
+        else:
+            inst += self.snippet_push_d
+        self.emit_inst(inst)
 
-        elif memory == "static":
-            global clazz
-            inst = f"""
-{self.snippet_pop_d}
-@{clazz}.static.{num}
-M=D
-            """
-        elif memory == "pointer":
-            if num == 0:
-                dest = "THIS"
-            else:
-                dest = "THAT"
-            inst = f"""
-{self.snippet_pop_d}
-@{dest}
-M=D
-            """
-        elif memory == "temp":
-            inst = f"""
-@{num}
-D=A
-@5
-D=D+A
-@R13
-M=D
+    def emit_move(self, memory, num, dest_memory, dest_num):
+        # push + pop without the stack
+        self.flush()
+        self.emit_inst(self.load_d(memory, num) + self.store_d(dest_memory, dest_num))
 
-{self.snippet_pop_d}
-@R13
-A=M
-M=D
-            """
+    def emit_pop(self, memory, num):
+        # sp--; *(memory+num)= *sp, the general sequence keeps the address in
+        # R13
+        if self.tos_in_d:
+            self.tos_in_d = False
+            self.emit_inst(self.store_d(memory, num))
+            return
+        inst = self.cheapest(
+            "pop",
+            memory,
+            self.snippet_pop_d + self.segment_address(memory, num) + "M=D\n",
+            lambda: self.general_address(memory, num, "D")
+            + "@R13\nM=D\n"
+            + self.snippet_pop_d
+            + "@R13\nA=M\nM=D\n",
+        )
         self.emit_inst(inst)
 
 
@@ -431,120 +807,456 @@ def p_program(p):
 
 def p_label(p):
     """stmt : LABEL BRANCH_LABEL"""
-    global emitter
-    emitter.emit_label(p[2])
+    p.lexer.commands.append(("label", p[2]))
 
 
 def p_goto(p):
     """stmt : GOTO BRANCH_LABEL"""
-    global emitter
-    emitter.emit_goto(p[2])
+    p.lexer.commands.append(("goto", p[2]))
 
 
 def p_if_goto(p):
     """stmt : IF_GOTO BRANCH_LABEL"""
-    global emitter
-    emitter.emit_if_goto(p[2])
+    p.lexer.commands.append(("if-goto", p[2]))
 
 
 def p_bool_op(p):
     """stmt : EQ
-            | GT
-            | LT
+    | GT
+    | LT
     """
-    global emitter
-    emitter.emit_bool(p[1])
+    p.lexer.commands.append((p[1],))
 
 
 def p_unary_op(p):
     """stmt : NEG
-            | NOT
+    | NOT
     """
-    global emitter
-    emitter.emit_unary(p[1])
+    p.lexer.commands.append((p[1],))
 
 
 def p_binary_op(p):
     """stmt : ADD
-            | SUB
-            | OR
-            | AND
+    | SUB
+    | OR
+    | AND
     """
-    global emitter
-    emitter.emit_binary(p[1])
+    p.lexer.commands.append((p[1],))
 
 
 def p_push_op(p):
     """stmt : PUSH LOCAL NUMBER
-            | PUSH ARGUMENT NUMBER
-            | PUSH THIS NUMBER
-            | PUSH THAT NUMBER
-            | PUSH TEMP NUMBER
-            | PUSH CONSTANT NUMBER
-            | PUSH POINTER NUMBER
-            | PUSH STATIC NUMBER
+    | PUSH ARGUMENT NUMBER
+    | PUSH THIS NUMBER
+    | PUSH THAT NUMBER
+    | PUSH TEMP NUMBER
+    | PUSH CONSTANT NUMBER
+    | PUSH POINTER NUMBER
+    | PUSH STATIC NUMBER
     """
-    global emitter
-    emitter.emit_push(p[2], int(p[3]))
+    p.lexer.commands.append(("push", p[2], int(p[3])))
 
 
 def p_pop_op(p):
     """stmt : POP LOCAL NUMBER
-            | POP ARGUMENT NUMBER
-            | POP THIS NUMBER
-            | POP THAT NUMBER
-            | POP TEMP NUMBER
-            | POP CONSTANT NUMBER
-            | POP POINTER NUMBER
-            | POP STATIC NUMBER
+    | POP ARGUMENT NUMBER
+    | POP THIS NUMBER
+    | POP THAT NUMBER
+    | POP TEMP NUMBER
+    | POP CONSTANT NUMBER
+    | POP POINTER NUMBER
+    | POP STATIC NUMBER
     """
-    global emitter
-    emitter.emit_pop(p[2], int(p[3]))
+    p.lexer.commands.append(("pop", p[2], int(p[3])))
 
 
 def p_function(p):
     """stmt : FUNCTION BRANCH_LABEL NUMBER"""
-    global emitter
-    emitter.emit_function(p[2], int(p[3]))
+    p.lexer.commands.append(("function", p[2], int(p[3])))
 
 
 def p_return(p):
     """stmt : RETURN"""
-    global emitter
-    emitter.emit_return()
+    p.lexer.commands.append(("return",))
 
 
 def p_call(p):
     """stmt : CALL BRANCH_LABEL NUMBER"""
-    global emitter
-    emitter.emit_call(p[2], int(p[3]))
+    p.lexer.commands.append(("call", p[2], int(p[3])))
+
 
+def load_parsetab():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.py")
+    spec = importlib.util.spec_from_file_location(__name__ + "_parsetab", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parser = yacc.yacc(debug=False, write_tables=False, tabmodule=load_parsetab())
+
+
+def read_sources(files_or_sources):
+    # a directory, a .vm path or an iterable of directories, .vm paths and
+    # (class, source) pairs -> (class, source) pairs
+    if isinstance(files_or_sources, str):
+        files_or_sources = [files_or_sources]
+    for item in files_or_sources:
+        if isinstance(item, tuple):
+            yield item
+        elif os.path.isdir(item):
+            yield from read_sources(glob.glob(item + "/*.vm"))
+        else:
+            with open(item) as f:
+                yield os.path.basename(item).replace(".vm", ""), f.read()
+
+
+def parse_commands(data, vm_lexer):
+    # -> the commands of a .vm source as tuples: ("push", "local", 0),
+    # ("add",), ("call", "Main.main", 0)...
+    vm_lexer.commands = []
+    vm_lexer.lineno = 1
+    parser.parse(data, lexer=vm_lexer)
+    return vm_lexer.commands
+
+
+def translate_unit(unit, options, optimize_vm=False):
+    # one class, (class, source) or (class, commands) -> (its code, the shared
+    # routines it uses, the VM optimizer stats, the instructions saved by the
+    # segment addressing)
+    clazz, data = unit
+    if isinstance(data, str):
+        data = parse_commands(data, lexer.clone())
+    stats = Counter()
+    if optimize_vm:
+        data = VMOptimizer.optimize(data, stats)
+    emitter = Emitter(None, **options)
+    emitter.set_class(clazz)
+    emitter.emit_commands(data)
+    emitter.flush()
+    return "".join(emitter.sink), emitter.routines, stats, emitter.addressing
+
+
+translator_digest = None
+
+
+def translator_version():
+    # a translated class depends on the code of the translator as much as on
+    # its source
+    global translator_digest
+    if translator_digest is None:
+        digest = hashlib.sha256()
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in ("VMTranslator.py", "VMOptimizer.py"):
+            with open(os.path.join(here, name), "rb") as f:
+                digest.update(f.read())
+        translator_digest = digest.digest()
+    return translator_digest
+
+
+class FragmentCache:
+    # the results of `translate_unit` kept between builds, one file per class
+    # in `directory` named by the hash of everything the translation depends
+    # on. Hits refresh the file's mtime and the least recently used files go
+    # once the directory holds more than `max_size` bytes
+    def __init__(self, directory, max_size=64 << 20):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, unit, options, optimize_vm):
+        clazz, data = unit
+        digest = hashlib.sha256(translator_version())
+        digest.update(repr((sorted(options.items()), optimize_vm, clazz)).encode())
+        # the source, or the commands left by the whole program pass
+        digest.update(data.encode() if isinstance(data, str) else repr(data).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        # written aside and renamed, builds sharing the directory never read
+        # a partial file
+        path = os.path.join(self.directory, key)
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "wb") as f:
+            pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+
+    def report(self):
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return "translation cache: %d hits, %d misses (%.1f%% hit rate), %d evicted" % (
+            self.hits,
+            self.misses,
+            100 * rate,
+            self.evicted,
+        )
+
+
+def translate(
+    files_or_sources,
+    sink=None,
+    bootstrap=False,
+    compact=False,
+    shared_compare=False,
+    cache_tos=False,
+    tail_calls=False,
+    optimize_vm=False,
+    stats=None,
+    addressing=None,
+    inline=False,
+    inlined=None,
+    whole_program=False,
+    dropped=None,
+    jobs=1,
+    cache=None,
+    objects=None,
+):
+    # translates into `sink` (see `Emitter`) and returns it, or returns the
+    # text when no sink is given. With `optimize_vm` the commands go through
+    # `VMOptimizer` first, which counts its rewrites in `stats`. The
+    # instructions the segment accesses save over the general sequence are
+    # counted in `addressing` (see `report_addressing`). With `inline` the
+    # calls of small leaf functions are replaced by their bodies and counted
+    # in `inlined`. With `whole_program` the functions unreachable from
+    # Sys.init are left out and listed in `dropped`.
+    # Every class is translated on its own, in `jobs` processes (0 or None:
+    # one per cpu), and the results are joined in class order: the output
+    # does not depend on the order of the inputs, and calls may run side by
+    # side. A `FragmentCache` supplies the classes translated before.
+    # With `objects` (a list) nothing is joined: the bootstrap, every class
+    # and the shared routines are appended to it as relocatable objects (see
+    # 06/linker.py) and it is returned
+    options = {
+        "compact": compact,
+        "shared_compare": shared_compare,
+        "cache_tos": cache_tos,
+        "tail_calls": tail_calls,
+    }
+    units = sorted(read_sources(files_or_sources), key=lambda unit: unit[0])
+    if inline or whole_program:
+        vm_lexer = lexer.clone()
+        units = [(clazz, parse_commands(data, vm_lexer)) for clazz, data in units]
+    if inline:
+        units = VMOptimizer.inline_functions(units, inlined)
+    if whole_program:
+        units = VMOptimizer.remove_dead_functions(units, dropped)
+
+    keys = [None] * len(units)
+    results = [None] * len(units)
+    if cache is not None:
+        for i, unit in enumerate(units):
+            keys[i] = cache.key(unit, options, optimize_vm)
+            results[i] = cache.get(keys[i])
+    todo = [i for i, result in enumerate(results) if result is None]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(todo) < 2:
+        translated = [translate_unit(units[i], options, optimize_vm) for i in todo]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(min(jobs, len(todo))) as pool:
+            translated = list(
+                pool.map(
+                    translate_unit,
+                    [units[i] for i in todo],
+                    repeat(options),
+                    repeat(optimize_vm),
+                )
+            )
+    for i, result in zip(todo, translated):
+        results[i] = result
+        if cache is not None:
+            cache.put(keys[i], result)
+    if cache is not None:
+        cache.evict()
+
+    if stats is not None:
+        for _, _, unit_stats, _ in results:
+            stats.update(unit_stats)
+    if addressing is not None:
+        for _, _, _, unit_addressing in results:
+            addressing.update(unit_addressing)
+    if objects is not None:
+        return translate_objects(units, results, objects, bootstrap, options)
+
+    emitter = Emitter(sink, **options)
+    if bootstrap:
+        emitter.bootstrap()
+    for text, routines, _, _ in results:
+        emitter.emit_inst(text)
+        emitter.routines |= routines
+    emitter.emit_routines()
+    if sink is None:
+        return "".join(emitter.sink)
+    return sink
+
+
+def import_linker():
+    # the linker lives with the assembler in projects/06
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "06")
+    if path not in sys.path:
+        sys.path.append(path)
+    import linker
+
+    return linker
+
+
+# the variables of the generated code: statics, the inline segment and the
+# scratch variables of calls and returns. Every other symbol it refers to is
+# a function or a label
+scratch_variables = {"ret_addr", "old_arg", "new_arg", *frame_variables}
+
+
+def is_variable(symbol):
+    return (
+        symbol in scratch_variables
+        or ".static." in symbol
+        or symbol.startswith("__VM.inline.")
+    )
+
+
+def translate_objects(units, results, objects, bootstrap, options):
+    linker = import_linker()
+    if bootstrap:
+        emitter = Emitter(None, **options)
+        emitter.bootstrap()
+        boot = "".join(emitter.sink)
+        objects.append(
+            linker.make_object(boot, "__VM.boot", "first", options, is_variable)
+        )
+    for (clazz, _), (text, _, _, _) in zip(units, results):
+        objects.append(
+            linker.make_object(text, clazz, options=options, is_variable=is_variable)
+        )
+    emitter = Emitter(None, **options)
+    emitter.enable_routines()
+    emitter.emit_routines()
+    if emitter.sink:
+        runtime = "".join(emitter.sink)
+        objects.append(
+            linker.make_object(runtime, "__VM.runtime", "last", options, is_variable)
+        )
+    return objects
+
+
+def report_addressing(addressing):
+    lines = ["segment addressing: %d instructions saved" % sum(addressing.values())]
+    for name, count in sorted(addressing.items()):
+        if count:
+            lines.append("  %-20s %d" % (name, count))
+    return "\n".join(lines)
 
-parser = yacc.yacc()
 
 import sys
 
-if len(sys.argv) != 3:
-    print("usage: VMTranslator.py <input> <output>")
-    sys.exit(1)
-
-import glob, os
-
-input_file = sys.argv[1]
-output_file = sys.argv[2]
-emitter = Emitter(output_file)
-
-if os.path.isdir(input_file):
-    input_files = glob.glob(input_file + "/*.vm")
-    emitter.bootstrap()
-else:
-    input_files = [input_file]
-
-clazz = ""
-for input_file in input_files:
-    with open(input_file) as f:
-        clazz = os.path.basename(input_file).replace(".vm", "")
-        data = f.read()
-        parser.parse(data)
-        
-emitter.close()
+if __name__ == "__main__":
+    flags = {
+        "-O",
+        "--compact",
+        "--shared-compare",
+        "--cache-tos",
+        "--optimize-vm",
+        "--whole-program",
+        "--objects",
+        "--tail-calls",
+        "--report-addressing",
+        "--inline",
+    }
+    args = sys.argv[1:]
+    # -j N: translate the classes in N processes (0: one per cpu)
+    # --cache DIR: keep the translated classes in DIR between builds
+    values = {"-j": "1", "--cache": None}
+    for name in values:
+        if name in args[:-1]:
+            i = args.index(name)
+            values[name] = args[i + 1]
+            del args[i : i + 2]
+    options = {arg for arg in args if arg in flags}
+    args = [arg for arg in args if arg not in flags]
+    if len(args) < 2:
+        print(
+            "usage: VMTranslator.py [-O] [--compact] [--shared-compare] "
+            "[--cache-tos] [--tail-calls] [--optimize-vm] [--inline] "
+            "[--whole-program] [-j N] [--cache DIR] [--objects] "
+            "[--report-addressing] <input>... <output>"
+        )
+        sys.exit(1)
+
+    input_files = args[:-1]
+    output_file = args[-1]
+    bootstrap = any(os.path.isdir(input_file) for input_file in input_files)
+    codegen = {
+        "compact": "--compact" in options,
+        "shared_compare": "--shared-compare" in options,
+        "cache_tos": "--cache-tos" in options,
+        "tail_calls": "--tail-calls" in options,
+        "optimize_vm": "--optimize-vm" in options,
+        "stats": Counter(),
+        "addressing": Counter(),
+        "inline": "--inline" in options,
+        "inlined": Counter(),
+        "whole_program": "--whole-program" in options,
+        "dropped": [],
+        "jobs": int(values["-j"]),
+        "cache": values["--cache"] and FragmentCache(values["--cache"]),
+    }
+
+    if "--objects" in options:
+        # the output is a directory getting one object per class
+        os.makedirs(output_file, exist_ok=True)
+        for obj in translate(input_files, bootstrap=bootstrap, objects=[], **codegen):
+            obj.save(os.path.join(output_file, obj.name + ".o"))
+    elif "-O" in options:
+        import AsmOptimizer
+
+        text, stats = AsmOptimizer.optimize(
+            translate(input_files, bootstrap=bootstrap, **codegen)
+        )
+        with open(output_file, "w") as f:
+            f.write(text)
+        print(AsmOptimizer.report(stats))
+    else:
+        with open(output_file, "w") as f:
+            translate(input_files, f, bootstrap, **codegen)
+    if codegen["optimize_vm"]:
+        print(VMOptimizer.report(codegen["stats"]))
+    if "--report-addressing" in options:
+        print(report_addressing(codegen["addressing"]))
+    if codegen["inline"]:
+        print(VMOptimizer.report_inlined(codegen["inlined"]))
+    if codegen["whole_program"]:
+        print(VMOptimizer.report_dead_functions(codegen["dropped"]))
+    if codegen["cache"]:
+        print(codegen["cache"].report())
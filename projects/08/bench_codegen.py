@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 16:40
+#
+# ROM size of the 08 and 11 programs under every code generation mode of the
+# translator, the instructions the segment addressing saves in the inline
+# mode, the cycles the 08 programs run until they halt and the cycle cost
+# per executed comparison in every mode, both measured with 06/emulator.py
+import os
+import re
+import sys
+from collections import Counter
+
+from VMTranslator import read_sources, translate
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, "..", "06"))
+from assembler import assemble
+from emulator import Emulator
+
+programs = [
+    "08/FunctionCalls/NestedCall",
+    "08/FunctionCalls/FibonacciElement",
+    "08/FunctionCalls/StaticsTest",
+    "11/Average",
+    "11/ComplexArrays",
+    "11/ConvertToBin",
+    "11/Pong",
+    "11/Seven",
+    "11/Square",
+]
+
+modes = [
+    ("inline", {}),
+    ("shared-cmp", {"shared_compare": True}),
+    ("compact", {"compact": True}),
+    ("both", {"compact": True, "shared_compare": True}),
+    ("cache-tos", {"cache_tos": True}),
+    ("opt-vm", {"optimize_vm": True}),
+]
+
+# the 08 programs end in a `goto` to itself, which the emulator detects
+halting_programs = [program for program in programs if program.startswith("08/")]
+max_cycles = 1000000
+
+# a comparison of temp 1 with temp 2, whose cost is measured against the same
+# program without it; the operands come from memory so that the VM optimizer
+# can not fold them
+compare_source = """function Main.main 0
+push temp 1
+push temp 2
+%s
+label END
+goto END
+"""
+# operands (temp 1, temp 2) giving true and false
+compare_operands = {
+    "eq": ((3, 3), (1, 2)),
+    "lt": ((1, 2), (1, 1)),
+    "gt": ((2, 1), (1, 1)),
+}
+
+
+def run_cycles(program, ram=()):
+    # -> the cycles until `program` halts, None if it does not within
+    # `max_cycles`
+    emulator = Emulator(program)
+    for address, value in ram:
+        emulator.ram[address] = value
+    emulator.run(max_cycles)
+    return emulator.cycles if emulator.halted else None
+
+
+def compare_cycles(command, operands, options):
+    # -> the cycles one comparison adds, from its operands on the stack to its
+    # result on the stack
+    def cycles(body):
+        program = assemble(translate([("Main", compare_source % body)], **options))
+        # SP, temp 1 and temp 2
+        return run_cycles(program, [(0, 256), (6, operands[0]), (7, operands[1])])
+
+    return cycles(command) - cycles("")
+
+
+def count_comparisons(path):
+    return sum(
+        len(re.findall(r"^\s*(eq|lt|gt)\b", source, re.M))
+        for _, source in read_sources(path)
+    )
+
+
+def main():
+    root = os.path.join(here, "..")
+    print(
+        "%-34s %5s" % ("program", "cmps")
+        + "".join(" %10s" % name for name, _ in modes)
+        + " %10s" % "addr-saved"
+    )
+    for program in programs:
+        path = os.path.join(root, program)
+        sizes = [
+            len(assemble(translate(path, bootstrap=True, **options)))
+            for _, options in modes
+        ]
+        addressing = Counter()
+        translate(path, bootstrap=True, addressing=addressing)
+        print(
+            "%-34s %5d" % (program, count_comparisons(path))
+            + "".join(" %10d" % size for size in sizes)
+            + " %10d" % sum(addressing.values())
+        )
+
+    print("\ncycles until halt")
+    for program in halting_programs:
+        path = os.path.join(root, program)
+        cycles = [
+            run_cycles(assemble(translate(path, bootstrap=True, **options)))
+            for _, options in modes
+        ]
+        print(
+            "%-40s" % program
+            + "".join(" %10s" % ("-" if n is None else n) for n in cycles)
+        )
+
+    print("\ncycles per comparison (true/false)")
+    for command, (true, false) in compare_operands.items():
+        print(
+            "%-40s" % command
+            + "".join(
+                " %10s"
+                % (
+                    "%d/%d"
+                    % (
+                        compare_cycles(command, true, options),
+                        compare_cycles(command, false, options),
+                    )
+                )
+                for _, options in modes
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 # 2018-09-05 13:33
+import importlib.util
+import os
+
 import ply.lex as lex
 import ply.yacc as yacc
 
@@ -286,24 +289,33 @@ def p_argument_var_list(p):
     """
 
 
-parser = yacc.yacc()
+def load_parsetab():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parsetab.py")
+    spec = importlib.util.spec_from_file_location(__name__ + "_parsetab", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parser = yacc.yacc(debug=False, write_tables=False, tabmodule=load_parsetab())
 
 import sys
 
-if len(sys.argv) != 2:
-    print("usage: JackAnalizer.py <input>")
-    sys.exit(1)
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: JackAnalizer.py <input>")
+        sys.exit(1)
 
-import glob, os
+    import glob
 
-input_file = sys.argv[1]
+    input_file = sys.argv[1]
 
-if os.path.isdir(input_file):
-    input_files = glob.glob(input_file + "/*.jack")
-else:
-    input_files = [input_file]
+    if os.path.isdir(input_file):
+        input_files = glob.glob(input_file + "/*.jack")
+    else:
+        input_files = [input_file]
 
-for input_file in input_files:
-    with open(input_file) as f:
-        data = f.read()
-        parser.parse(data)
+    for input_file in input_files:
+        with open(input_file) as f:
+            data = f.read()
+            parser.parse(data, lexer=lexer)
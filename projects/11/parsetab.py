@@ -1,11 +1,12 @@
 
 # parsetab.py
 # This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
 _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'NUMBER STRING OPEN_PARENT CLOSE_PARENT OPEN_BRACKET CLOSE_BRACKET OPEN_CURLY CLOSE_CURLY IDENT SEMICOLON DOT ADD MINUS TIMES DIVIDE EQUAL COMMA AND OR NOT GT LT FUNCTION THIS FIELD VAR METHOD TRUE CONSTRUCTOR RETURN ELSE FALSE INT CHAR IF STATIC VOID DO WHILE NULL LET CLASS BOOLEANclass : CLASS class_name OPEN_CURLY class_var_dec subroutine_dec CLOSE_CURLYclass_name : IDENTclass_var_dec : class_var_dec STATIC type IDENT var_list SEMICOLON class_var_dec\n                     | class_var_dec FIELD type IDENT var_list SEMICOLON \n                     | empty\n    empty :var_list : COMMA IDENT var_list\n                | empty\n     type : INT\n             | BOOLEAN\n             | CHAR\n             | IDENT\n    subroutine_dec :  subroutine_header subroutine_body subroutine_dec\n    subroutine_header : subroutine_category subroutine_return_type IDENT OPEN_PARENT parameter_list CLOSE_PARENTsubroutine_dec : empty\n    subroutine_category : CONSTRUCTOR\n                           | FUNCTION\n                           | METHOD\n    subroutine_return_type : VOID\n                              | type\n    parameter_list : parameter_var_list type IDENT \n                      | empty\n    parameter_var_list : parameter_var_list type IDENT COMMA \n                          | empty\n    subroutine_body : OPEN_CURLY var_dec stmt CLOSE_CURLY\n    var_dec : var_dec VAR type IDENT name_var_list SEMICOLON\n    var_dec : empty\n    name_var_list : COMMA IDENT name_var_list\n    name_var_list : empty\n    stmt : stmt stmtstmt : LET IDENT EQUAL expression SEMICOLONstmt : LET IDENT OPEN_BRACKET expression CLOSE_BRACKET EQUAL expression SEMICOLONstmt : IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLYif_expression : expressionstmt : IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY else OPEN_CURLY stmt CLOSE_CURLYelse : ELSEstmt : while OPEN_PARENT while_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLYwhile_expression : expressionwhile : WHILEstmt : DO subroutine_call SEMICOLONstmt : RETURN expression SEMICOLON\n            | RETURN SEMICOLON\n    expression : unary_op expression\n    expression : expression binary_op expression\n    expression : OPEN_PARENT expression CLOSE_PARENT    \n    expression : subroutine_call\n    expression : TRUE\n                  | FALSE\n                  | NULL\n    expression : THISexpression : IDENT OPEN_BRACKET expression CLOSE_BRACKETexpression : IDENTexpression : STRINGexpression : NUMBER\n    unary_op : NOT\n                | MINUS\n    binary_op : ADD\n                 | MINUS\n                 | TIMES\n                 | DIVIDE\n                 | AND\n                 | OR\n                 | GT\n                 | LT\n                 | EQUAL\n    subroutine_call : method_call_ident OPEN_PARENT argument_list CLOSE_PARENT\n    method_call_ident : IDENTsubroutine_call : function_call_ident OPEN_PARENT argument_list CLOSE_PARENT\n    function_call_ident : IDENT DOT IDENTargument_list : expression argument_var_list\n                     | empty\n    argument_var_list : COMMA expression argument_var_list\n                         | empty\n    '
+_lr_signature = 'ADD AND BOOLEAN CHAR CLASS CLOSE_BRACKET CLOSE_CURLY CLOSE_PARENT COMMA CONSTRUCTOR DIVIDE DO DOT ELSE EQUAL FALSE FIELD FUNCTION GT IDENT IF INT LET LT METHOD MINUS NOT NULL NUMBER OPEN_BRACKET OPEN_CURLY OPEN_PARENT OR RETURN SEMICOLON STATIC STRING THIS TIMES TRUE VAR VOID WHILEclass : CLASS class_name OPEN_CURLY class_var_dec subroutine_dec CLOSE_CURLYclass_name : IDENTclass_var_dec : class_var_dec STATIC type IDENT var_list SEMICOLON class_var_dec\n                     | class_var_dec FIELD type IDENT var_list SEMICOLON \n                     | empty\n    empty :var_list : COMMA IDENT var_list\n                | empty\n     type : INT\n             | BOOLEAN\n             | CHAR\n             | IDENT\n    subroutine_dec :  subroutine_header subroutine_body subroutine_dec\n    subroutine_header : subroutine_category subroutine_return_type IDENT OPEN_PARENT parameter_list CLOSE_PARENTsubroutine_dec : empty\n    subroutine_category : CONSTRUCTOR\n                           | FUNCTION\n                           | METHOD\n    subroutine_return_type : VOID\n                              | type\n    parameter_list : parameter_var_list type IDENT \n                      | empty\n    parameter_var_list : parameter_var_list type IDENT COMMA \n                          | empty\n    subroutine_body : OPEN_CURLY var_dec stmt CLOSE_CURLY\n    var_dec : var_dec VAR type IDENT name_var_list SEMICOLON\n    var_dec : empty\n    name_var_list : COMMA IDENT name_var_list\n    name_var_list : empty\n    stmt : stmt stmtstmt : LET IDENT EQUAL expression SEMICOLONstmt : LET IDENT OPEN_BRACKET expression CLOSE_BRACKET EQUAL expression SEMICOLONstmt : IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLYif_expression : expressionstmt : IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY else OPEN_CURLY stmt CLOSE_CURLYelse : ELSEstmt : while OPEN_PARENT while_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLYwhile_expression : expressionwhile : WHILEstmt : DO subroutine_call SEMICOLONstmt : RETURN expression SEMICOLON\n            | RETURN SEMICOLON\n    expression : unary_op expression\n    expression : expression binary_op expression\n    expression : OPEN_PARENT expression CLOSE_PARENT    \n    expression : subroutine_call\n    expression : TRUE\n                  | FALSE\n                  | NULL\n    expression : THISexpression : IDENT OPEN_BRACKET expression CLOSE_BRACKETexpression : IDENTexpression : STRINGexpression : NUMBER\n    unary_op : NOT\n                | MINUS\n    binary_op : ADD\n                 | MINUS\n                 | TIMES\n                 | DIVIDE\n                 | AND\n                 | OR\n                 | GT\n                 | LT\n                 | EQUAL\n    subroutine_call : method_call_ident OPEN_PARENT argument_list CLOSE_PARENT\n    method_call_ident : IDENTsubroutine_call : function_call_ident OPEN_PARENT argument_list CLOSE_PARENT\n    function_call_ident : IDENT DOT IDENTargument_list : expression argument_var_list\n                     | empty\n    argument_var_list : COMMA expression argument_var_list\n                         | empty\n    '
     
 _lr_action_items = {'CLASS':([0,],[2,]),'$end':([1,17,],[0,-1,]),'IDENT':([2,9,10,13,14,15,16,18,19,20,21,22,23,26,27,28,36,40,41,44,45,47,53,55,56,63,64,73,74,76,77,81,82,88,89,90,92,93,94,95,96,97,98,99,100,101,104,106,108,131,135,137,],[4,19,19,19,-16,-17,-18,29,-12,-9,-10,-11,30,34,-19,-20,49,19,54,60,70,-6,80,70,70,70,70,-55,-56,19,-24,70,70,70,70,118,70,-57,-58,-59,-60,-61,-62,-63,-64,-65,70,122,124,70,-23,70,]),'OPEN_CURLY':([3,4,11,105,112,113,146,147,],[5,-2,25,-14,127,128,148,-36,]),'STATIC':([5,6,7,48,50,78,],[-6,9,-5,-6,-4,9,]),'FIELD':([5,6,7,48,50,78,],[-6,10,-5,-6,-4,10,]),'CONSTRUCTOR':([5,6,7,24,48,50,52,78,],[-6,14,-5,14,-6,-4,-25,-3,]),'FUNCTION':([5,6,7,24,48,50,52,78,],[-6,15,-5,15,-6,-4,-25,-3,]),'METHOD':([5,6,7,24,48,50,52,78,],[-6,16,-5,16,-6,-4,-25,-3,]),'CLOSE_CURLY':([5,6,7,8,12,24,31,39,48,50,51,52,62,78,87,91,125,138,139,142,143,145,149,150,],[-6,-6,-5,17,-15,-6,-13,52,-6,-4,-30,-25,-42,-3,-40,-41,-31,142,143,-33,-37,-32,150,-35,]),'INT':([9,10,13,14,15,16,40,47,76,77,135,],[20,20,20,-16,-17,-18,20,-6,20,-24,-23,]),'BOOLEAN':([9,10,13,14,15,16,40,47,76,77,135,],[21,21,21,-16,-17,-18,21,-6,21,-24,-23,]),'CHAR':([9,10,13,14,15,16,40,47,76,77,135,],[22,22,22,-16,-17,-18,22,-6,22,-24,-23,]),'VOID':([13,14,15,16,],[27,-16,-17,-18,]),'VAR':([25,32,33,123,],[-6,40,-27,-26,]),'LET':([25,32,33,39,51,62,87,91,123,125,127,128,138,139,142,143,145,148,149,150,],[-6,41,-27,41,41,-42,-40,-41,-26,-31,41,41,41,41,-33,-37,-32,41,41,-35,]),'IF':([25,32,33,39,51,62,87,91,123,125,127,128,138,139,142,143,145,148,149,150,],[-6,42,-27,42,42,-42,-40,-41,-26,-31,42,42,42,42,-33,-37,-32,42,42,-35,]),'DO':([25,32,33,39,51,62,87,91,123,125,127,128,138,139,142,143,145,148,149,150,],[-6,44,-27,44,44,-42,-40,-41,-26,-31,44,44,44,44,-33,-37,-32,44,44,-35,]),'RETURN':([25,32,33,39,51,62,87,91,123,125,127,128,138,139,142,143,145,148,149,150,],[-6,45,-27,45,45,-42,-40,-41,-26,-31,45,45,45,45,-33,-37,-32,45,45,-35,]),'WHILE':([25,32,33,39,51,62,87,91,123,125,127,128,138,139,142,143,145,148,149,150,],[-6,46,-27,46,46,-42,-40,-41,-26,-31,46,46,46,46,-33,-37,-32,46,46,-35,]),'COMMA':([29,30,49,65,66,67,68,69,70,71,72,80,102,115,119,120,122,124,129,133,134,140,],[36,36,36,-46,-47,-48,-49,-50,-52,-53,-54,108,-43,131,-44,-45,135,108,-66,-68,-51,131,]),'SEMICOLON':([29,30,35,37,38,45,49,57,61,65,66,67,68,69,70,71,72,79,80,102,107,109,110,119,120,124,129,133,134,136,141,],[-6,-6,48,-8,50,62,-6,87,91,-46,-47,-48,-49,-50,-52,-53,-54,-7,-6,-43,123,-29,125,-44,-45,-6,-66,-68,-51,-28,145,]),'OPEN_PARENT':([34,42,43,45,46,55,56,58,59,60,63,64,70,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,118,131,137,],[47,55,56,64,-39,64,64,88,89,-67,64,64,-67,-55,-56,64,64,64,64,64,-57,-58,-59,-60,-61,-62,-63,-64,-65,64,-69,64,64,]),'TRUE':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[66,66,66,66,66,-55,-56,66,66,66,66,66,-57,-58,-59,-60,-61,-62,-63,-64,-65,66,66,66,]),'FALSE':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[67,67,67,67,67,-55,-56,67,67,67,67,67,-57,-58,-59,-60,-61,-62,-63,-64,-65,67,67,67,]),'NULL':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[68,68,68,68,68,-55,-56,68,68,68,68,68,-57,-58,-59,-60,-61,-62,-63,-64,-65,68,68,68,]),'THIS':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[69,69,69,69,69,-55,-56,69,69,69,69,69,-57,-58,-59,-60,-61,-62,-63,-64,-65,69,69,69,]),'STRING':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[71,71,71,71,71,-55,-56,71,71,71,71,71,-57,-58,-59,-60,-61,-62,-63,-64,-65,71,71,71,]),'NUMBER':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[72,72,72,72,72,-55,-56,72,72,72,72,72,-57,-58,-59,-60,-61,-62,-63,-64,-65,72,72,72,]),'NOT':([45,55,56,63,64,73,74,81,82,88,89,92,93,94,95,96,97,98,99,100,101,104,131,137,],[73,73,73,73,73,-55,-56,73,73,73,73,73,-57,-58,-59,-60,-61,-62,-63,-64,-65,73,73,73,]),'MINUS':([45,55,56,61,63,64,65,66,67,68,69,70,71,72,73,74,81,82,84,86,88,89,92,93,94,95,96,97,98,99,100,101,102,103,104,110,111,115,119,120,121,129,131,133,134,137,140,141,],[74,74,74,94,74,74,-46,-47,-48,-49,-50,-52,-53,-54,-55,-56,74,74,94,94,74,74,74,-57,-58,-59,-60,-61,-62,-63,-64,-65,94,94,74,94,94,94,94,-45,94,-66,74,-68,-51,74,94,94,]),'CLOSE_PARENT':([47,65,66,67,68,69,70,71,72,75,77,83,84,85,86,88,89,102,103,114,115,116,117,119,120,122,129,130,132,133,134,140,144,],[-6,-46,-47,-48,-49,-50,-52,-53,-54,105,-22,112,-34,113,-38,-6,-6,-43,120,129,-6,-71,133,-44,-45,-21,-66,-70,-73,-68,-51,-6,-72,]),'EQUAL':([54,61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,126,129,133,134,140,141,],[81,101,-46,-47,-48,-49,-50,-52,-53,-54,101,101,101,101,101,101,101,101,-45,101,137,-66,-68,-51,101,101,]),'OPEN_BRACKET':([54,70,],[82,104,]),'DOT':([60,70,],[90,90,]),'ADD':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[93,-46,-47,-48,-49,-50,-52,-53,-54,93,93,93,93,93,93,93,93,-45,93,-66,-68,-51,93,93,]),'TIMES':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[95,-46,-47,-48,-49,-50,-52,-53,-54,95,95,95,95,95,95,95,95,-45,95,-66,-68,-51,95,95,]),'DIVIDE':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[96,-46,-47,-48,-49,-50,-52,-53,-54,96,96,96,96,96,96,96,96,-45,96,-66,-68,-51,96,96,]),'AND':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[97,-46,-47,-48,-49,-50,-52,-53,-54,97,97,97,97,97,97,97,97,-45,97,-66,-68,-51,97,97,]),'OR':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[98,-46,-47,-48,-49,-50,-52,-53,-54,98,98,98,98,98,98,98,98,-45,98,-66,-68,-51,98,98,]),'GT':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[99,-46,-47,-48,-49,-50,-52,-53,-54,99,99,99,99,99,99,99,99,-45,99,-66,-68,-51,99,99,]),'LT':([61,65,66,67,68,69,70,71,72,84,86,102,103,110,111,115,119,120,121,129,133,134,140,141,],[100,-46,-47,-48,-49,-50,-52,-53,-54,100,100,100,100,100,100,100,100,-45,100,-66,-68,-51,100,100,]),'CLOSE_BRACKET':([65,66,67,68,69,70,71,72,102,111,119,120,121,129,133,134,],[-46,-47,-48,-49,-50,-52,-53,-54,-43,126,-44,-45,134,-66,-68,-51,]),'ELSE':([142,],[147,]),}
 
@@ -26,77 +27,77 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> class","S'",1,None,None,None),
-  ('class -> CLASS class_name OPEN_CURLY class_var_dec subroutine_dec CLOSE_CURLY','class',6,'p_class','JackCompiler.py',128),
-  ('class_name -> IDENT','class_name',1,'p_class_name','JackCompiler.py',134),
-  ('class_var_dec -> class_var_dec STATIC type IDENT var_list SEMICOLON class_var_dec','class_var_dec',7,'p_class_var_dec','JackCompiler.py',140),
-  ('class_var_dec -> class_var_dec FIELD type IDENT var_list SEMICOLON','class_var_dec',6,'p_class_var_dec','JackCompiler.py',141),
-  ('class_var_dec -> empty','class_var_dec',1,'p_class_var_dec','JackCompiler.py',142),
-  ('empty -> <empty>','empty',0,'p_empty','JackCompiler.py',152),
-  ('var_list -> COMMA IDENT var_list','var_list',3,'p_var_list','JackCompiler.py',156),
-  ('var_list -> empty','var_list',1,'p_var_list','JackCompiler.py',157),
-  ('type -> INT','type',1,'p_type','JackCompiler.py',166),
-  ('type -> BOOLEAN','type',1,'p_type','JackCompiler.py',167),
-  ('type -> CHAR','type',1,'p_type','JackCompiler.py',168),
-  ('type -> IDENT','type',1,'p_type','JackCompiler.py',169),
-  ('subroutine_dec -> subroutine_header subroutine_body subroutine_dec','subroutine_dec',3,'p_subroutine_dec','JackCompiler.py',175),
-  ('subroutine_header -> subroutine_category subroutine_return_type IDENT OPEN_PARENT parameter_list CLOSE_PARENT','subroutine_header',6,'p_subroutine_header','JackCompiler.py',180),
-  ('subroutine_dec -> empty','subroutine_dec',1,'p_subroutine_dec_2','JackCompiler.py',186),
-  ('subroutine_category -> CONSTRUCTOR','subroutine_category',1,'p_subroutine_category','JackCompiler.py',191),
-  ('subroutine_category -> FUNCTION','subroutine_category',1,'p_subroutine_category','JackCompiler.py',192),
-  ('subroutine_category -> METHOD','subroutine_category',1,'p_subroutine_category','JackCompiler.py',193),
-  ('subroutine_return_type -> VOID','subroutine_return_type',1,'p_subroutine_return_type','JackCompiler.py',202),
-  ('subroutine_return_type -> type','subroutine_return_type',1,'p_subroutine_return_type','JackCompiler.py',203),
-  ('parameter_list -> parameter_var_list type IDENT','parameter_list',3,'p_parameter_list','JackCompiler.py',208),
-  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','JackCompiler.py',209),
-  ('parameter_var_list -> parameter_var_list type IDENT COMMA','parameter_var_list',4,'p_parameter_var_list','JackCompiler.py',217),
-  ('parameter_var_list -> empty','parameter_var_list',1,'p_parameter_var_list','JackCompiler.py',218),
-  ('subroutine_body -> OPEN_CURLY var_dec stmt CLOSE_CURLY','subroutine_body',4,'p_subroutine_body','JackCompiler.py',226),
-  ('var_dec -> var_dec VAR type IDENT name_var_list SEMICOLON','var_dec',6,'p_var_dec','JackCompiler.py',234),
-  ('var_dec -> empty','var_dec',1,'p_var_dec_empty','JackCompiler.py',243),
-  ('name_var_list -> COMMA IDENT name_var_list','name_var_list',3,'p_name_var_list','JackCompiler.py',248),
-  ('name_var_list -> empty','name_var_list',1,'p_name_var_list_empty','JackCompiler.py',254),
-  ('stmt -> stmt stmt','stmt',2,'p_stmt','JackCompiler.py',260),
-  ('stmt -> LET IDENT EQUAL expression SEMICOLON','stmt',5,'p_let_stmt','JackCompiler.py',264),
-  ('stmt -> LET IDENT OPEN_BRACKET expression CLOSE_BRACKET EQUAL expression SEMICOLON','stmt',8,'p_let_array_stmt','JackCompiler.py',270),
-  ('stmt -> IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY','stmt',7,'p_if_stmt','JackCompiler.py',276),
-  ('if_expression -> expression','if_expression',1,'p_if_expression','JackCompiler.py',282),
-  ('stmt -> IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY else OPEN_CURLY stmt CLOSE_CURLY','stmt',11,'p_if_else_stmt','JackCompiler.py',288),
-  ('else -> ELSE','else',1,'p_else','JackCompiler.py',294),
-  ('stmt -> while OPEN_PARENT while_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY','stmt',7,'p_while_stmt','JackCompiler.py',300),
-  ('while_expression -> expression','while_expression',1,'p_while_expression','JackCompiler.py',306),
-  ('while -> WHILE','while',1,'p_while','JackCompiler.py',312),
-  ('stmt -> DO subroutine_call SEMICOLON','stmt',3,'p_do_stmt','JackCompiler.py',318),
-  ('stmt -> RETURN expression SEMICOLON','stmt',3,'p_return_stmt','JackCompiler.py',324),
-  ('stmt -> RETURN SEMICOLON','stmt',2,'p_return_stmt','JackCompiler.py',325),
-  ('expression -> unary_op expression','expression',2,'p_expression','JackCompiler.py',334),
-  ('expression -> expression binary_op expression','expression',3,'p_expression_binary_op','JackCompiler.py',341),
-  ('expression -> OPEN_PARENT expression CLOSE_PARENT','expression',3,'p_expression_2','JackCompiler.py',348),
-  ('expression -> subroutine_call','expression',1,'p_expression_single','JackCompiler.py',353),
-  ('expression -> TRUE','expression',1,'p_expression_true_false','JackCompiler.py',358),
-  ('expression -> FALSE','expression',1,'p_expression_true_false','JackCompiler.py',359),
-  ('expression -> NULL','expression',1,'p_expression_true_false','JackCompiler.py',360),
-  ('expression -> THIS','expression',1,'p_expression_this','JackCompiler.py',370),
-  ('expression -> IDENT OPEN_BRACKET expression CLOSE_BRACKET','expression',4,'p_expression_array','JackCompiler.py',376),
-  ('expression -> IDENT','expression',1,'p_expression_ident','JackCompiler.py',382),
-  ('expression -> STRING','expression',1,'p_expression_string','JackCompiler.py',388),
-  ('expression -> NUMBER','expression',1,'p_expression_single_1','JackCompiler.py',394),
-  ('unary_op -> NOT','unary_op',1,'p_unary_op','JackCompiler.py',401),
-  ('unary_op -> MINUS','unary_op',1,'p_unary_op','JackCompiler.py',402),
-  ('binary_op -> ADD','binary_op',1,'p_binary_op','JackCompiler.py',408),
-  ('binary_op -> MINUS','binary_op',1,'p_binary_op','JackCompiler.py',409),
-  ('binary_op -> TIMES','binary_op',1,'p_binary_op','JackCompiler.py',410),
-  ('binary_op -> DIVIDE','binary_op',1,'p_binary_op','JackCompiler.py',411),
-  ('binary_op -> AND','binary_op',1,'p_binary_op','JackCompiler.py',412),
-  ('binary_op -> OR','binary_op',1,'p_binary_op','JackCompiler.py',413),
-  ('binary_op -> GT','binary_op',1,'p_binary_op','JackCompiler.py',414),
-  ('binary_op -> LT','binary_op',1,'p_binary_op','JackCompiler.py',415),
-  ('binary_op -> EQUAL','binary_op',1,'p_binary_op','JackCompiler.py',416),
-  ('subroutine_call -> method_call_ident OPEN_PARENT argument_list CLOSE_PARENT','subroutine_call',4,'p_method_call','JackCompiler.py',422),
-  ('method_call_ident -> IDENT','method_call_ident',1,'p_method_call_ident','JackCompiler.py',428),
-  ('subroutine_call -> function_call_ident OPEN_PARENT argument_list CLOSE_PARENT','subroutine_call',4,'p_function_call','JackCompiler.py',434),
-  ('function_call_ident -> IDENT DOT IDENT','function_call_ident',3,'p_function_call_ident','JackCompiler.py',441),
-  ('argument_list -> expression argument_var_list','argument_list',2,'p_argument_list','JackCompiler.py',448),
-  ('argument_list -> empty','argument_list',1,'p_argument_list','JackCompiler.py',449),
-  ('argument_var_list -> COMMA expression argument_var_list','argument_var_list',3,'p_argument_var_list','JackCompiler.py',458),
-  ('argument_var_list -> empty','argument_var_list',1,'p_argument_var_list','JackCompiler.py',459),
+  ('class -> CLASS class_name OPEN_CURLY class_var_dec subroutine_dec CLOSE_CURLY','class',6,'p_class','JackCompiler.py',131),
+  ('class_name -> IDENT','class_name',1,'p_class_name','JackCompiler.py',137),
+  ('class_var_dec -> class_var_dec STATIC type IDENT var_list SEMICOLON class_var_dec','class_var_dec',7,'p_class_var_dec','JackCompiler.py',143),
+  ('class_var_dec -> class_var_dec FIELD type IDENT var_list SEMICOLON','class_var_dec',6,'p_class_var_dec','JackCompiler.py',144),
+  ('class_var_dec -> empty','class_var_dec',1,'p_class_var_dec','JackCompiler.py',145),
+  ('empty -> <empty>','empty',0,'p_empty','JackCompiler.py',155),
+  ('var_list -> COMMA IDENT var_list','var_list',3,'p_var_list','JackCompiler.py',159),
+  ('var_list -> empty','var_list',1,'p_var_list','JackCompiler.py',160),
+  ('type -> INT','type',1,'p_type','JackCompiler.py',169),
+  ('type -> BOOLEAN','type',1,'p_type','JackCompiler.py',170),
+  ('type -> CHAR','type',1,'p_type','JackCompiler.py',171),
+  ('type -> IDENT','type',1,'p_type','JackCompiler.py',172),
+  ('subroutine_dec -> subroutine_header subroutine_body subroutine_dec','subroutine_dec',3,'p_subroutine_dec','JackCompiler.py',178),
+  ('subroutine_header -> subroutine_category subroutine_return_type IDENT OPEN_PARENT parameter_list CLOSE_PARENT','subroutine_header',6,'p_subroutine_header','JackCompiler.py',183),
+  ('subroutine_dec -> empty','subroutine_dec',1,'p_subroutine_dec_2','JackCompiler.py',189),
+  ('subroutine_category -> CONSTRUCTOR','subroutine_category',1,'p_subroutine_category','JackCompiler.py',194),
+  ('subroutine_category -> FUNCTION','subroutine_category',1,'p_subroutine_category','JackCompiler.py',195),
+  ('subroutine_category -> METHOD','subroutine_category',1,'p_subroutine_category','JackCompiler.py',196),
+  ('subroutine_return_type -> VOID','subroutine_return_type',1,'p_subroutine_return_type','JackCompiler.py',205),
+  ('subroutine_return_type -> type','subroutine_return_type',1,'p_subroutine_return_type','JackCompiler.py',206),
+  ('parameter_list -> parameter_var_list type IDENT','parameter_list',3,'p_parameter_list','JackCompiler.py',211),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','JackCompiler.py',212),
+  ('parameter_var_list -> parameter_var_list type IDENT COMMA','parameter_var_list',4,'p_parameter_var_list','JackCompiler.py',220),
+  ('parameter_var_list -> empty','parameter_var_list',1,'p_parameter_var_list','JackCompiler.py',221),
+  ('subroutine_body -> OPEN_CURLY var_dec stmt CLOSE_CURLY','subroutine_body',4,'p_subroutine_body','JackCompiler.py',229),
+  ('var_dec -> var_dec VAR type IDENT name_var_list SEMICOLON','var_dec',6,'p_var_dec','JackCompiler.py',237),
+  ('var_dec -> empty','var_dec',1,'p_var_dec_empty','JackCompiler.py',246),
+  ('name_var_list -> COMMA IDENT name_var_list','name_var_list',3,'p_name_var_list','JackCompiler.py',251),
+  ('name_var_list -> empty','name_var_list',1,'p_name_var_list_empty','JackCompiler.py',257),
+  ('stmt -> stmt stmt','stmt',2,'p_stmt','JackCompiler.py',263),
+  ('stmt -> LET IDENT EQUAL expression SEMICOLON','stmt',5,'p_let_stmt','JackCompiler.py',267),
+  ('stmt -> LET IDENT OPEN_BRACKET expression CLOSE_BRACKET EQUAL expression SEMICOLON','stmt',8,'p_let_array_stmt','JackCompiler.py',273),
+  ('stmt -> IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY','stmt',7,'p_if_stmt','JackCompiler.py',279),
+  ('if_expression -> expression','if_expression',1,'p_if_expression','JackCompiler.py',285),
+  ('stmt -> IF OPEN_PARENT if_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY else OPEN_CURLY stmt CLOSE_CURLY','stmt',11,'p_if_else_stmt','JackCompiler.py',291),
+  ('else -> ELSE','else',1,'p_else','JackCompiler.py',297),
+  ('stmt -> while OPEN_PARENT while_expression CLOSE_PARENT OPEN_CURLY stmt CLOSE_CURLY','stmt',7,'p_while_stmt','JackCompiler.py',303),
+  ('while_expression -> expression','while_expression',1,'p_while_expression','JackCompiler.py',309),
+  ('while -> WHILE','while',1,'p_while','JackCompiler.py',315),
+  ('stmt -> DO subroutine_call SEMICOLON','stmt',3,'p_do_stmt','JackCompiler.py',321),
+  ('stmt -> RETURN expression SEMICOLON','stmt',3,'p_return_stmt','JackCompiler.py',327),
+  ('stmt -> RETURN SEMICOLON','stmt',2,'p_return_stmt','JackCompiler.py',328),
+  ('expression -> unary_op expression','expression',2,'p_expression','JackCompiler.py',337),
+  ('expression -> expression binary_op expression','expression',3,'p_expression_binary_op','JackCompiler.py',344),
+  ('expression -> OPEN_PARENT expression CLOSE_PARENT','expression',3,'p_expression_2','JackCompiler.py',351),
+  ('expression -> subroutine_call','expression',1,'p_expression_single','JackCompiler.py',356),
+  ('expression -> TRUE','expression',1,'p_expression_true_false','JackCompiler.py',361),
+  ('expression -> FALSE','expression',1,'p_expression_true_false','JackCompiler.py',362),
+  ('expression -> NULL','expression',1,'p_expression_true_false','JackCompiler.py',363),
+  ('expression -> THIS','expression',1,'p_expression_this','JackCompiler.py',373),
+  ('expression -> IDENT OPEN_BRACKET expression CLOSE_BRACKET','expression',4,'p_expression_array','JackCompiler.py',379),
+  ('expression -> IDENT','expression',1,'p_expression_ident','JackCompiler.py',385),
+  ('expression -> STRING','expression',1,'p_expression_string','JackCompiler.py',391),
+  ('expression -> NUMBER','expression',1,'p_expression_single_1','JackCompiler.py',397),
+  ('unary_op -> NOT','unary_op',1,'p_unary_op','JackCompiler.py',404),
+  ('unary_op -> MINUS','unary_op',1,'p_unary_op','JackCompiler.py',405),
+  ('binary_op -> ADD','binary_op',1,'p_binary_op','JackCompiler.py',411),
+  ('binary_op -> MINUS','binary_op',1,'p_binary_op','JackCompiler.py',412),
+  ('binary_op -> TIMES','binary_op',1,'p_binary_op','JackCompiler.py',413),
+  ('binary_op -> DIVIDE','binary_op',1,'p_binary_op','JackCompiler.py',414),
+  ('binary_op -> AND','binary_op',1,'p_binary_op','JackCompiler.py',415),
+  ('binary_op -> OR','binary_op',1,'p_binary_op','JackCompiler.py',416),
+  ('binary_op -> GT','binary_op',1,'p_binary_op','JackCompiler.py',417),
+  ('binary_op -> LT','binary_op',1,'p_binary_op','JackCompiler.py',418),
+  ('binary_op -> EQUAL','binary_op',1,'p_binary_op','JackCompiler.py',419),
+  ('subroutine_call -> method_call_ident OPEN_PARENT argument_list CLOSE_PARENT','subroutine_call',4,'p_method_call','JackCompiler.py',425),
+  ('method_call_ident -> IDENT','method_call_ident',1,'p_method_call_ident','JackCompiler.py',432),
+  ('subroutine_call -> function_call_ident OPEN_PARENT argument_list CLOSE_PARENT','subroutine_call',4,'p_function_call','JackCompiler.py',439),
+  ('function_call_ident -> IDENT DOT IDENT','function_call_ident',3,'p_function_call_ident','JackCompiler.py',446),
+  ('argument_list -> expression argument_var_list','argument_list',2,'p_argument_list','JackCompiler.py',453),
+  ('argument_list -> empty','argument_list',1,'p_argument_list','JackCompiler.py',454),
+  ('argument_var_list -> COMMA expression argument_var_list','argument_var_list',3,'p_argument_var_list','JackCompiler.py',463),
+  ('argument_var_list -> empty','argument_var_list',1,'p_argument_var_list','JackCompiler.py',464),
 ]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 15:52
+#
+# startup benchmark: for every tool, the time from the start of its import to
+# the first token of a tiny input, and the wall time of the whole process
+# including the interpreter start, each measured in a fresh process
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from build_tables import root, tools
+
+# code run in the fresh process, prints the import-to-first-token time
+probe = """
+import importlib.util, os, sys, time
+start = time.perf_counter()
+directory, name = sys.argv[1], sys.argv[2]
+sys.path.insert(0, directory)
+spec = importlib.util.spec_from_file_location(name, os.path.join(directory, name + ".py"))
+module = sys.modules[name] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+if name == "assembler":
+    module.assemble("@0")
+else:
+    module.lexer.input(sys.argv[3])
+    module.lexer.token()
+print(time.perf_counter() - start)
+"""
+
+samples = {
+    "assembler": "@0",
+    "VMTranslator": "push constant 0",
+    "JackAnalizer": "class Main {}",
+    "JackCompiler": "class Main {}",
+}
+
+
+def measure(directory, name, runs):
+    best_first_token = best_process = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", probe, os.path.join(root, directory), name, samples[name]],
+            # run outside the tool directory, nothing may be written there
+            cwd=os.path.expanduser("~"),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        process = time.perf_counter() - start
+        first_token = float(output.split()[-1])
+        if best_process is None or process < best_process:
+            best_process = process
+        if best_first_token is None or first_token < best_first_token:
+            best_first_token = first_token
+    return best_first_token, best_process
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="tool startup benchmark")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print("%-20s %16s %10s" % ("tool", "first token", "process"))
+    for directory, name in tools:
+        first_token, process = measure(directory, name, args.runs)
+        print(
+            "%-20s %14.1fms %8.1fms"
+            % ("%s/%s" % (directory, name), 1e3 * first_token, 1e3 * process)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 2026-10-18 15:40
+#
+# regenerates parsetab.py next to every ply based tool, run it after changing
+# a grammar. The tools themselves only read their tables and never write them
+# (a stale table is rebuilt in memory on every start until this is run)
+import importlib.util
+import os
+import sys
+
+import ply.yacc as yacc
+
+root = os.path.dirname(os.path.abspath(__file__))
+
+tools = [
+    ("06", "assembler"),
+    ("07", "VMTranslator"),
+    ("08", "VMTranslator"),
+    ("10", "JackAnalizer"),
+    ("11", "JackCompiler"),
+]
+
+
+def load_tool(directory, name):
+    # tools import their neighbours (CompileEngine, rom...) by plain name
+    path = os.path.join(root, directory)
+    sys.path.insert(0, path)
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "tool%s_%s" % (directory, name), os.path.join(path, name + ".py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        # ply looks the rule functions' module up in sys.modules
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(path)
+    return module
+
+
+def build(directory, name):
+    module = load_tool(directory, name)
+    path = os.path.join(root, directory)
+    table = os.path.join(path, "parsetab.py")
+    with open(table) as f:
+        before = f.read()
+
+    # an up to date table is only read, anything else is regenerated and
+    # written back to the tool's directory
+    sys.modules.pop("parsetab", None)
+    sys.path.insert(0, path)
+    try:
+        yacc.yacc(
+            module=module,
+            debug=False,
+            write_tables=True,
+            tabmodule="parsetab",
+            outputdir=path,
+        )
+    finally:
+        sys.path.remove(path)
+        sys.modules.pop("parsetab", None)
+
+    with open(table) as f:
+        after = f.read()
+    print("%s/%s.py: %s" % (directory, name, "regenerated" if after != before else "up to date"))
+
+
+if __name__ == "__main__":
+    for directory, name in tools:
+        build(directory, name)